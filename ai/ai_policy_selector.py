@@ -12,6 +12,7 @@ while staying within token limits and optimizing AI processing costs.
 
 import json
 import logging
+import re
 from typing import Dict, List, Any, Optional, Tuple
 from models import (
     ClusterInfo,
@@ -28,6 +29,14 @@ from ai.kyverno_validator import KyvernoValidator
 from ai.output_manager import OutputManager
 from exceptions import AISelectionError, ValidationError
 
+# Patterns for pulling JSON out of free-form model responses
+_JSON_ARRAY_PATTERN = re.compile(r"\[.*?\]", re.DOTALL)
+_JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+_POLICY_NAME_ARRAY_PATTERN = re.compile(
+    r'\[\s*"[^"]+"\s*(?:,\s*"[^"]+"\s*)*\]', re.DOTALL
+)
+_QUOTED_POLICY_NAME_PATTERN = re.compile(r'"([a-z0-9-]+)"')
+
 
 class AIPolicySelector(AIPolicySelectorInterface):
     """Main AI policy selector that orchestrates the entire selection process."""
@@ -722,8 +731,7 @@ class AIPolicySelector(AIPolicySelectorInterface):
                 "node_count": cluster_info.node_count,
                 "namespace_count": cluster_info.namespace_count,
                 "third_party_controllers": [
-                    {"name": ctrl.name, "type": ctrl.type.value}
-                    for ctrl in cluster_info.third_party_controllers
+                    ctrl.to_dict() for ctrl in cluster_info.third_party_controllers
                 ],
                 "compliance_frameworks": cluster_info.compliance_frameworks,
             },
@@ -806,9 +814,7 @@ Example response format:
                 policy_names = json.loads(response)
             else:
                 # Try to find JSON array in response
-                import re
-
-                json_match = re.search(r"\[.*?\]", response, re.DOTALL)
+                json_match = _JSON_ARRAY_PATTERN.search(response)
                 if json_match:
                     policy_names = json.loads(json_match.group())
                 else:
@@ -1138,8 +1144,7 @@ Example response format:
                 "node_count": cluster_info.node_count,
                 "namespace_count": cluster_info.namespace_count,
                 "third_party_controllers": [
-                    {"name": ctrl.name, "type": ctrl.type.value}
-                    for ctrl in cluster_info.third_party_controllers
+                    ctrl.to_dict() for ctrl in cluster_info.third_party_controllers
                 ],
                 "compliance_frameworks": cluster_info.compliance_frameworks,
             },
@@ -1234,12 +1239,8 @@ Example response format:
                 policy_names = json.loads(response)
             else:
                 # Try to find JSON array in response - improved regex
-                import re
-
                 # Look for JSON array with better pattern matching
-                json_match = re.search(
-                    r'\[\s*"[^"]+"\s*(?:,\s*"[^"]+"\s*)*\]', response, re.DOTALL
-                )
+                json_match = _POLICY_NAME_ARRAY_PATTERN.search(response)
                 if json_match:
                     policy_names = json.loads(json_match.group())
                 else:
@@ -1252,9 +1253,7 @@ Example response format:
                     policy_names = []
 
                     # Method 1: Look for quoted strings that look like policy names
-                    import re
-
-                    quoted_matches = re.findall(r'"([a-z0-9-]+)"', response)
+                    quoted_matches = _QUOTED_POLICY_NAME_PATTERN.findall(response)
                     for match in quoted_matches:
                         if "-" in match and 3 < len(match) < 100:
                             policy_names.append(match)
@@ -1398,8 +1397,7 @@ Example response format:
                 "node_count": cluster_info.node_count,
                 "namespace_count": cluster_info.namespace_count,
                 "third_party_controllers": [
-                    {"name": ctrl.name, "type": ctrl.type.value}
-                    for ctrl in cluster_info.third_party_controllers
+                    ctrl.to_dict() for ctrl in cluster_info.third_party_controllers
                 ],
                 "compliance_frameworks": cluster_info.compliance_frameworks,
                 "security_features": cluster_info.security_features,
@@ -1503,9 +1501,7 @@ Ensure exactly {target_count} policies are selected with clear reasoning for eac
                 selection_data = json.loads(response)
             else:
                 # Try to find JSON object in response
-                import re
-
-                json_match = re.search(r"\{.*\}", response, re.DOTALL)
+                json_match = _JSON_OBJECT_PATTERN.search(response)
                 if json_match:
                     selection_data = json.loads(json_match.group())
                 else:
@@ -1591,6 +1587,26 @@ Ensure exactly {target_count} policies are selected with clear reasoning for eac
 
             customized_policies = []
 
+            # Requirement-derived tags are identical for every policy in the batch
+            registry_tags = [
+                f"registry:{registry}" for registry in requirements.registries
+            ]
+            label_tags = [
+                f"label:{key}={value}"
+                for key, value in requirements.custom_labels.items()
+            ]
+            compliance_tags = [
+                f"compliance:{framework}"
+                for framework in requirements.compliance_frameworks
+            ]
+            registry_suffix = (
+                f" [Customized for registries: {', '.join(requirements.registries)}]"
+            )
+            label_suffix = f" [Customized with labels: {requirements.custom_labels}]"
+            compliance_suffix = (
+                f" [Compliance: {', '.join(requirements.compliance_frameworks)}]"
+            )
+
             for policy in policies:
                 # Create a copy of the policy for customization
                 customized_policy = PolicyCatalogEntry(
@@ -1606,19 +1622,28 @@ Ensure exactly {target_count} policies are selected with clear reasoning for eac
                 # Apply registry customizations
                 if requirements.registries:
                     customized_policy = self._apply_registry_customization(
-                        customized_policy, requirements.registries
+                        customized_policy,
+                        requirements.registries,
+                        registry_tags,
+                        registry_suffix,
                     )
 
                 # Apply label customizations
                 if requirements.custom_labels:
                     customized_policy = self._apply_label_customization(
-                        customized_policy, requirements.custom_labels
+                        customized_policy,
+                        requirements.custom_labels,
+                        label_tags,
+                        label_suffix,
                     )
 
                 # Apply compliance-specific customizations
                 if requirements.compliance_frameworks:
                     customized_policy = self._apply_compliance_customization(
-                        customized_policy, requirements.compliance_frameworks
+                        customized_policy,
+                        requirements.compliance_frameworks,
+                        compliance_tags,
+                        compliance_suffix,
                     )
 
                 # Add AI-suggested customizations if available
@@ -1644,48 +1669,72 @@ Ensure exactly {target_count} policies are selected with clear reasoning for eac
             return policies
 
     def _apply_registry_customization(
-        self, policy: PolicyCatalogEntry, registries: List[str]
+        self,
+        policy: PolicyCatalogEntry,
+        registries: List[str],
+        registry_tags: Optional[List[str]] = None,
+        description_suffix: Optional[str] = None,
     ) -> PolicyCatalogEntry:
         """Apply registry-specific customizations to policy."""
         # Add registry information to policy tags for later processing
-        registry_tags = [f"registry:{registry}" for registry in registries]
+        if registry_tags is None:
+            registry_tags = [f"registry:{registry}" for registry in registries]
         policy.tags.extend(registry_tags)
 
         # Update description to indicate registry customization
-        if (
-            "registry" in policy.description.lower()
-            or "image" in policy.description.lower()
-        ):
-            policy.description += (
-                f" [Customized for registries: {', '.join(registries)}]"
-            )
+        description = policy.description.lower()
+        if "registry" in description or "image" in description:
+            if description_suffix is None:
+                description_suffix = (
+                    f" [Customized for registries: {', '.join(registries)}]"
+                )
+            policy.description += description_suffix
 
         return policy
 
     def _apply_label_customization(
-        self, policy: PolicyCatalogEntry, custom_labels: Dict[str, str]
+        self,
+        policy: PolicyCatalogEntry,
+        custom_labels: Dict[str, str],
+        label_tags: Optional[List[str]] = None,
+        description_suffix: Optional[str] = None,
     ) -> PolicyCatalogEntry:
         """Apply label-specific customizations to policy."""
+        if not custom_labels:
+            return policy
+
         # Add label information to policy tags for later processing
-        label_tags = [f"label:{key}={value}" for key, value in custom_labels.items()]
+        if label_tags is None:
+            label_tags = [
+                f"label:{key}={value}" for key, value in custom_labels.items()
+            ]
         policy.tags.extend(label_tags)
 
         # Update description to indicate label customization
         if "label" in policy.description.lower():
-            policy.description += f" [Customized with labels: {custom_labels}]"
+            if description_suffix is None:
+                description_suffix = f" [Customized with labels: {custom_labels}]"
+            policy.description += description_suffix
 
         return policy
 
     def _apply_compliance_customization(
-        self, policy: PolicyCatalogEntry, frameworks: List[str]
+        self,
+        policy: PolicyCatalogEntry,
+        frameworks: List[str],
+        compliance_tags: Optional[List[str]] = None,
+        description_suffix: Optional[str] = None,
     ) -> PolicyCatalogEntry:
         """Apply compliance framework-specific customizations to policy."""
         # Add compliance framework tags
-        compliance_tags = [f"compliance:{framework}" for framework in frameworks]
+        if compliance_tags is None:
+            compliance_tags = [f"compliance:{framework}" for framework in frameworks]
         policy.tags.extend(compliance_tags)
 
         # Update description to indicate compliance customization
-        policy.description += f" [Compliance: {', '.join(frameworks)}]"
+        if description_suffix is None:
+            description_suffix = f" [Compliance: {', '.join(frameworks)}]"
+        policy.description += description_suffix
 
         return policy
 
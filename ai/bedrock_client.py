@@ -7,10 +7,16 @@ import json
 import logging
 from typing import Dict, Any, Optional, List
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
 from interfaces import BedrockClientInterface
 from exceptions import AISelectionError, NetworkError
 
+# Keep-alive connections shared by concurrent requests on one client; sized
+# above the default TestCaseGenerator batch concurrency so no request has to
+# open a fresh TLS connection
+_MAX_POOL_CONNECTIONS = 16
+
 
 class BedrockClient(BedrockClientInterface):
     """AWS Bedrock client for AI policy operations."""
@@ -26,7 +32,11 @@ class BedrockClient(BedrockClientInterface):
         self.logger = logging.getLogger(__name__)
 
         try:
-            self.client = boto3.client("bedrock-runtime", region_name=region)
+            self.client = boto3.client(
+                "bedrock-runtime",
+                region_name=region,
+                config=Config(max_pool_connections=_MAX_POOL_CONNECTIONS),
+            )
         except NoCredentialsError:
             raise AISelectionError(
                 "AWS credentials not found",
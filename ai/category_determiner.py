@@ -5,11 +5,28 @@ Uses AWS Bedrock to intelligently organize policies into meaningful categories.
 
 import json
 import logging
+import re
 from typing import Dict, List, Any, Optional
 from models import ClusterInfo, PolicyCatalogEntry, GovernanceRequirements
 from ai.bedrock_client import BedrockClient
 from exceptions import AISelectionError
 
+# Patterns for pulling JSON out of free-form model responses
+_JSON_ARRAY_PATTERN = re.compile(r"\[.*?\]", re.DOTALL)
+_JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+# Category name fragment -> policy keywords used by the rule-based fallback,
+# each compiled into a single alternation so a policy is scanned once per group
+_FALLBACK_KEYWORD_PATTERNS = tuple(
+    (fragment, re.compile("|".join(map(re.escape, keywords))))
+    for fragment, keywords in (
+        ("security", ["security", "rbac", "psp", "privileged"]),
+        ("network", ["network", "ingress", "egress", "service"]),
+        ("resource", ["resource", "limit", "quota", "memory", "cpu"]),
+        ("platform", ["aws", "gcp", "azure", "eks", "aks", "gke"]),
+    )
+)
+
 
 class CategoryDeterminer:
     """Determines dynamic categories for policy organization using AI."""
@@ -166,9 +183,7 @@ Example response format:
                 categories = json.loads(response)
             else:
                 # Try to find JSON array in the response
-                import re
-
-                json_match = re.search(r"\[.*?\]", response, re.DOTALL)
+                json_match = _JSON_ARRAY_PATTERN.search(response)
                 if json_match:
                     categories = json.loads(json_match.group())
                 else:
@@ -333,9 +348,7 @@ Example response format:
             response = response.strip()
             if not response.startswith("{"):
                 # Try to extract JSON from response
-                import re
-
-                json_match = re.search(r"\{.*\}", response, re.DOTALL)
+                json_match = _JSON_OBJECT_PATTERN.search(response)
                 if json_match:
                     response = json_match.group()
                 else:
@@ -383,6 +396,18 @@ Example response format:
         """Fallback policy assignment based on simple rules."""
         category_mapping = {cat: [] for cat in categories}
 
+        # Resolve which keyword groups apply to each category once, in rule order
+        category_patterns = []
+        for category in categories:
+            category_lower = category.lower()
+            patterns = [
+                pattern
+                for fragment, pattern in _FALLBACK_KEYWORD_PATTERNS
+                if fragment in category_lower
+            ]
+            if patterns:
+                category_patterns.append((category, patterns))
+
         # Simple rule-based assignment
         for policy in policies:
             assigned = False
@@ -392,34 +417,11 @@ Example response format:
                 policy.name + " " + policy.description + " " + " ".join(policy.tags)
             ).lower()
 
-            for category in categories:
-                category_lower = category.lower()
-
-                if not assigned:
-                    if "security" in category_lower and any(
-                        word in policy_text
-                        for word in ["security", "rbac", "psp", "privileged"]
-                    ):
-                        category_mapping[category].append(policy)
-                        assigned = True
-                    elif "network" in category_lower and any(
-                        word in policy_text
-                        for word in ["network", "ingress", "egress", "service"]
-                    ):
-                        category_mapping[category].append(policy)
-                        assigned = True
-                    elif "resource" in category_lower and any(
-                        word in policy_text
-                        for word in ["resource", "limit", "quota", "memory", "cpu"]
-                    ):
-                        category_mapping[category].append(policy)
-                        assigned = True
-                    elif "platform" in category_lower and any(
-                        word in policy_text
-                        for word in ["aws", "gcp", "azure", "eks", "aks", "gke"]
-                    ):
-                        category_mapping[category].append(policy)
-                        assigned = True
+            for category, patterns in category_patterns:
+                if any(pattern.search(policy_text) for pattern in patterns):
+                    category_mapping[category].append(policy)
+                    assigned = True
+                    break
 
             # If not assigned, put in first available category
             if not assigned:
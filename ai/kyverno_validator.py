@@ -4,6 +4,7 @@ Executes Kyverno CLI tests and generates YAML reports with AI-powered fixing.
 """
 
 import os
+import re
 import json
 import yaml
 import logging
@@ -18,6 +19,17 @@ from exceptions import ValidationError
 from ai.bedrock_client import BedrockClient
 from ai.test_case_generator import TestCaseGenerator
 
+# Kyverno CLI output patterns, compiled once and shared by every parser below
+_JSON_ARRAY_PATTERN = re.compile(r"\[\s*\{.*?\}\s*\]", re.DOTALL)
+_SUMMARY_FAILED_PATTERN = re.compile(
+    r"Test Summary:\s*(\d+)\s+out\s+of\s+(\d+)\s+tests?\s+failed"
+)
+_SUMMARY_PASSED_PATTERN = re.compile(r"Test Summary:\s*(\d+)\s+tests?\s+passed")
+_SUMMARY_NUMBERS_PATTERN = re.compile(r"Test Summary:.*?(\d+).*?(\d+)")
+_TESTS_FAILED_PATTERN = re.compile(r"(\d+)\s+out\s+of\s+(\d+)\s+tests?\s+failed")
+_TESTS_PASSED_PATTERN = re.compile(r"(\d+)\s+tests?\s+passed")
+_ANSI_ESCAPE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 @dataclass
 class ValidationResult:
@@ -102,10 +114,18 @@ class KyvernoValidator(PolicyValidatorInterface):
         # Run Kyverno CLI test on the entire output directory
         cli_report = self._execute_kyverno_cli_test(output_dir)
 
+        # Generate missing test cases up front so the AI requests run concurrently
+        generated_tests = self._generate_missing_test_cases(policies, output_dir)
+
         # Process each policy
         for policy in policies:
             try:
-                result = self._validate_single_policy(policy, output_dir, cli_report)
+                result = self._validate_single_policy(
+                    policy,
+                    output_dir,
+                    cli_report,
+                    generated_tests.get(policy.original_policy.name),
+                )
                 validation_results.append(result)
 
                 # Update statistics
@@ -139,10 +159,44 @@ class KyvernoValidator(PolicyValidatorInterface):
         self.logger.info(f"Validation completed: {self.validation_stats}")
         return validation_results, report_file
 
+    def _generate_missing_test_cases(
+        self, policies: List[RecommendedPolicy], output_dir: str
+    ) -> Dict[str, str]:
+        """Generate test cases for all policies without one in a single batch."""
+        if not (self.enable_ai_fixes and self.test_case_generator):
+            return {}
+
+        missing_tests = {}
+        for policy in policies:
+            policy_name = policy.original_policy.name
+            policy_dir = self._find_policy_directory(policy_name, output_dir)
+            if policy_dir and not os.path.exists(
+                os.path.join(policy_dir, "kyverno-test.yaml")
+            ):
+                missing_tests[policy_name] = policy.customized_content
+
+        if not missing_tests:
+            return {}
+
+        self.logger.info(f"Generating test cases for {len(missing_tests)} policies")
+        try:
+            return self.test_case_generator.generate_test_cases_batch(missing_tests)
+        except Exception as e:
+            self.logger.error(f"Failed to generate test cases in batch: {e}")
+            return {}
+
     def _validate_single_policy(
-        self, policy: RecommendedPolicy, output_dir: str, cli_report: Dict[str, Any]
+        self,
+        policy: RecommendedPolicy,
+        output_dir: str,
+        cli_report: Dict[str, Any],
+        generated_test: Optional[str] = None,
     ) -> ValidationResult:
-        """Validate a single policy and apply fixes if enabled."""
+        """Validate a single policy and apply fixes if enabled.
+
+        generated_test is a test case already generated for this policy by
+        _generate_missing_test_cases; without it one is generated here.
+        """
         policy_name = policy.original_policy.name
         self.logger.info(f"Validating policy: {policy_name}")
 
@@ -164,7 +218,8 @@ class KyvernoValidator(PolicyValidatorInterface):
             self.logger.info(f"Generating test cases for {policy_name}")
             try:
                 test_content = (
-                    self.test_case_generator.generate_comprehensive_test_case(
+                    generated_test
+                    or self.test_case_generator.generate_comprehensive_test_case(
                         policy.customized_content, policy_name
                     )
                 )
@@ -301,9 +356,8 @@ class KyvernoValidator(PolicyValidatorInterface):
 
             # Generate missing resource files
             resource_file = os.path.join(policy_dir, "resource.yaml")
-            if (
-                not os.path.exists(resource_file)
-                or "no such file" in str(result.errors).lower()
+            if not os.path.exists(resource_file) or any(
+                "no such file" in error.lower() for error in result.errors
             ):
                 resource_content = self._generate_test_resources_with_ai(
                     policy, error_analysis
@@ -362,10 +416,8 @@ class KyvernoValidator(PolicyValidatorInterface):
             combined_output = result.stdout + "\n" + result.stderr
 
             # Look for JSON in the combined output
-            import re
-
             # Look for JSON array pattern that can span multiple lines
-            json_match = re.search(r"\[\s*\{.*?\}\s*\]", combined_output, re.DOTALL)
+            json_match = _JSON_ARRAY_PATTERN.search(combined_output)
             if json_match:
                 json_line = json_match.group(0)
                 try:
@@ -393,9 +445,9 @@ class KyvernoValidator(PolicyValidatorInterface):
 
                 if not json_output:
                     # Check if we have any failures indicated by return code
+                    stderr_lower = result.stderr.lower()
                     if result.returncode != 0 and (
-                        "failed" in result.stderr.lower()
-                        or "error" in result.stderr.lower()
+                        "failed" in stderr_lower or "error" in stderr_lower
                     ):
                         self.logger.info(
                             "Kyverno CLI indicated failures but no JSON found"
@@ -642,13 +694,8 @@ class KyvernoValidator(PolicyValidatorInterface):
                     cli_output = result.test_results.get("cli_full_output", "")
 
                 if cli_output and "Test Summary:" in cli_output:
-                    import re
-
                     # Look for pattern like "Test Summary: 1 out of 229 tests failed"
-                    match = re.search(
-                        r"Test Summary:\s*(\d+)\s+out\s+of\s+(\d+)\s+tests?\s+failed",
-                        cli_output,
-                    )
+                    match = _SUMMARY_FAILED_PATTERN.search(cli_output)
                     if match:
                         failed_tests = int(match.group(1))
                         total_tests = int(match.group(2))
@@ -658,9 +705,7 @@ class KyvernoValidator(PolicyValidatorInterface):
                         break
 
                     # Also look for pattern like "Test Summary: 229 tests passed"
-                    match = re.search(
-                        r"Test Summary:\s*(\d+)\s+tests?\s+passed", cli_output
-                    )
+                    match = _SUMMARY_PASSED_PATTERN.search(cli_output)
                     if match and total_tests == 0:
                         total_tests = int(match.group(1))
                         failed_tests = 0
@@ -670,7 +715,7 @@ class KyvernoValidator(PolicyValidatorInterface):
                         break
 
                     # Look for any other Test Summary patterns
-                    match = re.search(r"Test Summary:.*?(\d+).*?(\d+)", cli_output)
+                    match = _SUMMARY_NUMBERS_PATTERN.search(cli_output)
                     if match and total_tests == 0:
                         # Try to determine which number is which based on context
                         num1, num2 = int(match.group(1)), int(match.group(2))
@@ -808,8 +853,6 @@ class KyvernoValidator(PolicyValidatorInterface):
             if fixed_content and fixed_content != current_test:
                 # Validate the fixed content is valid YAML
                 try:
-                    import yaml
-
                     yaml.safe_load(fixed_content)
 
                     # Write the fixed content
@@ -830,12 +873,9 @@ class KyvernoValidator(PolicyValidatorInterface):
 
                 except yaml.YAMLError as e:
                     self.logger.warning(f"AI-generated fix has invalid YAML: {e}")
-                    # Restore from backup
+                    # The test file is only written after validation, so it is
+                    # still intact and the backup can simply be discarded
                     if os.path.exists(backup_path):
-                        with open(backup_path, "r", encoding="utf-8") as f:
-                            backup_content = f.read()
-                        with open(test_file_path, "w", encoding="utf-8") as f:
-                            f.write(backup_content)
                         os.remove(backup_path)
                     result.warnings.append(
                         f"Test failure fix failed: Invalid YAML generated"
@@ -1048,8 +1088,6 @@ CORRECTED TEST FILE:
             if fixed_content and fixed_content != original_content:
                 # Validate the fixed content is valid YAML
                 try:
-                    import yaml
-
                     yaml.safe_load(fixed_content)
 
                     # Write the fixed content
@@ -1070,12 +1108,9 @@ CORRECTED TEST FILE:
 
                 except yaml.YAMLError as e:
                     self.logger.warning(f"AI-generated fix has invalid YAML: {e}")
-                    # Restore from backup
+                    # The test file is only written after validation, so it is
+                    # still intact and the backup can simply be discarded
                     if os.path.exists(backup_path):
-                        with open(backup_path, "r", encoding="utf-8") as f:
-                            backup_content = f.read()
-                        with open(test_file_path, "w", encoding="utf-8") as f:
-                            f.write(backup_content)
                         os.remove(backup_path)
                     result.warnings.append(
                         f"Test file fix failed: Invalid YAML generated"
@@ -1412,29 +1447,23 @@ TEST RESOURCES:
             combined_output = stdout + "\n" + stderr
 
             if "Test Summary:" in combined_output:
-                import re
-
-                match = re.search(
-                    r"(\d+)\s+out\s+of\s+(\d+)\s+tests?\s+failed", combined_output
-                )
+                match = _TESTS_FAILED_PATTERN.search(combined_output)
                 if match:
                     report["failed_tests"] = int(match.group(1))
                     report["total_tests"] = int(match.group(2))
                 else:
-                    match = re.search(r"(\d+)\s+tests?\s+passed", combined_output)
+                    match = _TESTS_PASSED_PATTERN.search(combined_output)
                     if match:
                         report["total_tests"] = int(match.group(1))
                         report["failed_tests"] = 0
             else:
                 # If no Test Summary, try to count PASS/FAIL lines in stdout
                 if stdout:
-                    import re
-
-                    pass_matches = re.findall(r"PASS:", stdout)
-                    fail_matches = re.findall(r"FAIL:", stdout)
-                    if pass_matches or fail_matches:
-                        report["total_tests"] = len(pass_matches) + len(fail_matches)
-                        report["failed_tests"] = len(fail_matches)
+                    pass_count = stdout.count("PASS:")
+                    fail_count = stdout.count("FAIL:")
+                    if pass_count or fail_count:
+                        report["total_tests"] = pass_count + fail_count
+                        report["failed_tests"] = fail_count
 
             # Calculate success rate
             if report["total_tests"] > 0:
@@ -1481,16 +1510,12 @@ TEST RESOURCES:
 
         # Look for test summary in combined output
         if "Test Summary:" in combined_output:
-            import re
-
-            match = re.search(
-                r"(\d+)\s+out\s+of\s+(\d+)\s+tests?\s+failed", combined_output
-            )
+            match = _TESTS_FAILED_PATTERN.search(combined_output)
             if match:
                 report["failed_tests"] = int(match.group(1))
                 report["total_tests"] = int(match.group(2))
             else:
-                match = re.search(r"(\d+)\s+tests?\s+passed", combined_output)
+                match = _TESTS_PASSED_PATTERN.search(combined_output)
                 if match:
                     report["total_tests"] = int(match.group(1))
                     report["failed_tests"] = 0
@@ -1780,15 +1805,21 @@ TEST RESOURCES:
     def _generate_basic_test_resources(self, policy: RecommendedPolicy) -> str:
         """Generate basic test resources without AI."""
         try:
-            policy_data = yaml.safe_load(policy.customized_content)
-            policy_name = policy.original_policy.name
+            policy_name = policy.original_policy.name.lower()
 
             # Special cases for known policy types
-            if "service-mesh" in policy_name.lower():
+            if "service-mesh" in policy_name:
                 return self._generate_service_mesh_resources()
-            elif "disallow-default-namespace" in policy_name.lower():
+            elif "disallow-default-namespace" in policy_name:
                 return self._generate_namespace_resources()
-            elif "require-pod-resources" in policy_name.lower():
+            elif "require-pod-resources" in policy_name:
+                return self._generate_resource_limit_resources()
+
+            # Fall back to the policy structure when the name is not conclusive
+            policy_data = yaml.safe_load(policy.customized_content)
+            if isinstance(policy_data, dict) and self._requires_resource_limits(
+                policy_data
+            ):
                 return self._generate_resource_limit_resources()
 
             # Generic resource generation
@@ -1807,6 +1838,30 @@ TEST RESOURCES:
                 return True
         return False
 
+    def _requires_resource_limits(self, policy_data: Dict[str, Any]) -> bool:
+        """Check if policy validates container resource limits."""
+        rules = policy_data.get("spec", {}).get("rules", [])
+        for rule in rules:
+            if self._rule_has_path(
+                rule,
+                ("validate", "pattern", "spec", "containers", "resources", "limits"),
+            ):
+                return True
+        return False
+
+    @staticmethod
+    def _rule_has_path(node: Any, path: Tuple[str, ...]) -> bool:
+        """Check if a nested key path exists, descending into any list items."""
+        for index, key in enumerate(path):
+            if isinstance(node, list):
+                return any(
+                    KyvernoValidator._rule_has_path(item, path[index:]) for item in node
+                )
+            if not isinstance(node, dict) or key not in node:
+                return False
+            node = node[key]
+        return True
+
     def _generate_fix_recommendations(
         self, validation_results: List[ValidationResult]
     ) -> List[str]:
@@ -1873,9 +1928,7 @@ TEST RESOURCES:
         for line in lines:
             if "Test Summary:" in line:
                 # Parse line like "Test Summary: 1 out of 229 tests failed"
-                import re
-
-                match = re.search(r"(\d+)\s+out\s+of\s+(\d+)\s+tests?\s+failed", line)
+                match = _TESTS_FAILED_PATTERN.search(line)
                 if match:
                     summary["failed_tests"] = int(match.group(1))
                     summary["total_tests"] = int(match.group(2))
@@ -1911,10 +1964,7 @@ TEST RESOURCES:
 
     def _strip_ansi_codes(self, text: str) -> str:
         """Remove ANSI escape codes from text."""
-        import re
-
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        return _ANSI_ESCAPE_PATTERN.sub("", text)
 
     def _clean_result_for_report(self, result: ValidationResult) -> Dict[str, Any]:
         """Clean validation result for YAML report (exclude verbose CLI output)."""
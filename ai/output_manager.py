@@ -4,15 +4,46 @@ Organizes policies in dynamic categories with test cases and validation reports.
 """
 
 import os
+import re
+import shutil
 import yaml
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from dataclasses import asdict
 from models import PolicyRecommendation, RecommendedPolicy
 from ai.kyverno_validator import ValidationResult
 from exceptions import FileSystemError
+from utils.yaml_utils import SafeDumper
+
+# Buffer size for streamed report writes, large enough for one flush per file
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Matches "kinds: [Pod, Deployment]" and block-style "kinds:\n  - Pod" lists;
+# block lists may contain comment and blank lines
+_KINDS_FLOW_PATTERN = re.compile(r"^[ \t]*kinds:[ \t]*\[([^\]]*)\]", re.MULTILINE)
+_KINDS_BLOCK_PATTERN = re.compile(
+    r"^([ \t]*)kinds:[ \t]*\n((?:\1[ \t]*-[ \t]*[^\n]+\n?|[ \t]*(?:#[^\n]*)?\n)+)",
+    re.MULTILINE,
+)
+# Matches every kinds key, including ones inside flow mappings
+_KINDS_KEY_PATTERN = re.compile(r"\bkinds:")
+# Matches an "all:" key, whose kinds the YAML-based extraction ignores
+_MATCH_ALL_PATTERN = re.compile(r"^[ \t]*(?:-[ \t]*)?all:", re.MULTILINE)
+
+# Human-readable descriptions for the well-known policy categories
+_CATEGORY_DESCRIPTIONS = {
+    "best-practices": "General Kubernetes best practices and operational excellence policies",
+    "security": "Security-focused policies for workload and cluster protection",
+    "compliance": "Compliance framework policies for regulatory requirements",
+    "network-security": "Network security and ingress/egress control policies",
+    "resource-management": "Resource allocation and management policies",
+    "workload-security": "Workload-specific security and runtime policies",
+    "storage-management": "Storage and persistent volume management policies",
+    "security-and-compliance": "Combined security and compliance policies",
+}
 
 
 class OutputManager:
@@ -22,6 +53,8 @@ class OutputManager:
         """Initialize output manager."""
         self.output_directory = output_directory
         self.logger = logging.getLogger(__name__)
+        # Shared "generated_at" value while organize_policies_by_categories runs
+        self._run_timestamp: Optional[str] = None
 
     def organize_policies_by_categories(
         self,
@@ -29,15 +62,16 @@ class OutputManager:
         validation_results: List[ValidationResult],
     ) -> Dict[str, str]:
         """Organize policies into dynamic category-based folder structure."""
+        self._run_timestamp = datetime.now().isoformat()
         try:
-            # Create output directory
-            os.makedirs(self.output_directory, exist_ok=True)
-
             # Group policies by category
             category_policies = self._group_policies_by_category(
                 recommendation.recommended_policies, recommendation.categories
             )
 
+            # Create output, category and policy directories up front
+            category_dirs = self._create_output_directories(category_policies)
+
             # Create validation results lookup
             validation_lookup = {
                 result.policy_name: result for result in validation_results
@@ -47,11 +81,7 @@ class OutputManager:
 
             # Process each category
             for category, policies in category_policies.items():
-                category_dir = os.path.join(
-                    self.output_directory, self._sanitize_category_name(category)
-                )
-                os.makedirs(category_dir, exist_ok=True)
-
+                category_dir = category_dirs[category]
                 category_files = []
 
                 # Process each policy in the category
@@ -66,7 +96,9 @@ class OutputManager:
                 created_files[category] = category_files
 
             # Create summary files
-            self._create_recommendation_summary(recommendation, validation_results)
+            self._create_recommendation_summary(
+                recommendation, validation_results, category_policies
+            )
             self._create_validation_report(validation_results)
             self._create_category_index(category_policies, validation_results)
 
@@ -78,18 +110,22 @@ class OutputManager:
         except Exception as e:
             self.logger.error(f"Error organizing policies: {e}")
             raise FileSystemError(f"Failed to organize policies: {e}")
+        finally:
+            self._run_timestamp = None
 
     def create_policy_directory_structure(
         self,
         policy: RecommendedPolicy,
         base_dir: str,
         validation_result: Optional[ValidationResult] = None,
+        create_dirs: bool = True,
     ) -> List[str]:
         """Create directory structure for a single policy with all files."""
         try:
             policy_name = self._sanitize_policy_name(policy.original_policy.name)
             policy_dir = os.path.join(base_dir, policy_name)
-            os.makedirs(policy_dir, exist_ok=True)
+            if create_dirs:
+                os.makedirs(policy_dir, exist_ok=True)
 
             created_files = []
 
@@ -121,8 +157,6 @@ class OutputManager:
                         original_test_dir, "kyverno-test.yaml"
                     )
                     if os.path.exists(original_test_file):
-                        import shutil
-
                         shutil.copy2(original_test_file, test_file)
                         created_files.append(test_file)
                         self.logger.info(
@@ -192,9 +226,15 @@ class OutputManager:
 
             # Create policy metadata file
             metadata_file = os.path.join(policy_dir, "policy-info.yaml")
-            metadata_content = self._create_policy_metadata(policy, validation_result)
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                f.write(yaml.dump(metadata_content, default_flow_style=False))
+            metadata_content = self._create_policy_metadata(
+                policy, validation_result, original_policy_filename
+            )
+            with open(
+                metadata_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+            ) as f:
+                yaml.dump(
+                    metadata_content, f, Dumper=SafeDumper, default_flow_style=False
+                )
             created_files.append(metadata_file)
 
             return created_files
@@ -217,15 +257,13 @@ class OutputManager:
                     self.output_directory, "validation-report.yaml"
                 )
 
-            # Calculate statistics
+            # Group results by status and calculate statistics
+            passed_results, failed_results, fixed_policies = (
+                self._partition_validation_results(validation_results)
+            )
             total_policies = len(validation_results)
-            passed_policies = sum(1 for r in validation_results if r.passed)
-            failed_policies = total_policies - passed_policies
-            fixed_policies = sum(1 for r in validation_results if r.fixed_content)
-
-            # Group results by status
-            passed_results = [r for r in validation_results if r.passed]
-            failed_results = [r for r in validation_results if not r.passed]
+            passed_policies = len(passed_results)
+            failed_policies = len(failed_results)
 
             report = {
                 "validation_summary": {
@@ -238,7 +276,7 @@ class OutputManager:
                         else "0%"
                     ),
                     "automatically_fixed": fixed_policies,
-                    "generated_at": datetime.now().isoformat(),
+                    "generated_at": self._get_run_timestamp(),
                 },
                 "passed_policies": [
                     {"name": r.policy_name, "warnings": r.warnings}
@@ -253,14 +291,16 @@ class OutputManager:
                     for r in failed_results
                 ],
                 "recommendations": self._generate_validation_recommendations(
-                    validation_results
+                    failed_policies, fixed_policies
                 ),
             }
 
             # Write report
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(yaml.dump(report, default_flow_style=False))
+            with open(
+                output_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+            ) as f:
+                yaml.dump(report, f, Dumper=SafeDumper, default_flow_style=False)
 
             self.logger.info(f"Validation report created: {output_file}")
             return output_file
@@ -301,6 +341,7 @@ This directory contains {total_policies} Kyverno policies recommended for your K
             category_policies = self._group_policies_by_category(
                 recommendation.recommended_policies, recommendation.categories
             )
+            passed_counts = self._count_passed_by_policy(validation_results)
 
             for category, policies in category_policies.items():
                 guide_content += f"\n### {category.replace('-', ' ').title()}\n"
@@ -312,12 +353,7 @@ This directory contains {total_policies} Kyverno policies recommended for your K
                 # List policies in category
                 for policy in policies:
                     validation_status = (
-                        "✅"
-                        if any(
-                            r.policy_name == policy.original_policy.name and r.passed
-                            for r in validation_results
-                        )
-                        else "❌"
+                        "✅" if passed_counts[policy.original_policy.name] else "❌"
                     )
                     guide_content += (
                         f"  - {validation_status} {policy.original_policy.name}\n"
@@ -418,27 +454,57 @@ The following customizations were applied based on your requirements:
         self, policies: List[RecommendedPolicy], categories: List[str]
     ) -> Dict[str, List[RecommendedPolicy]]:
         """Group policies by their assigned categories."""
-        category_policies = {}
-
-        # Initialize categories
+        # Seed with the requested categories so their order is preserved
+        category_policies = defaultdict(list)
         for category in categories:
-            category_policies[category] = []
+            category_policies[category]
 
         # Group policies
         for policy in policies:
             category = (
                 policy.category if policy.category else policy.original_policy.category
             )
-
-            # Ensure category exists
-            if category not in category_policies:
-                category_policies[category] = []
-
             category_policies[category].append(policy)
 
         # Remove empty categories
         return {k: v for k, v in category_policies.items() if v}
 
+    def _get_run_timestamp(self) -> str:
+        """Return the current run's timestamp, or now outside of a run."""
+        return self._run_timestamp or datetime.now().isoformat()
+
+    def _partition_validation_results(
+        self, validation_results: List[ValidationResult]
+    ) -> Tuple[List[ValidationResult], List[ValidationResult], int]:
+        """Split results into passed and failed lists and count fixed ones in one pass."""
+        passed_results = []
+        failed_results = []
+        fixed_count = 0
+
+        for result in validation_results:
+            if result.passed:
+                passed_results.append(result)
+            else:
+                failed_results.append(result)
+            if result.fixed_content:
+                fixed_count += 1
+
+        return passed_results, failed_results, fixed_count
+
+    def _count_passed_by_policy(
+        self, validation_results: List[ValidationResult]
+    ) -> Counter:
+        """Count passing validation results per policy name."""
+        return Counter(r.policy_name for r in validation_results if r.passed)
+
+    def _count_category_passed(
+        self, policies: List[RecommendedPolicy], passed_counts: Counter
+    ) -> int:
+        """Count passing validation results for the policies of one category."""
+        return sum(
+            passed_counts[name] for name in {p.original_policy.name for p in policies}
+        )
+
     def _create_policy_files(
         self,
         policy: RecommendedPolicy,
@@ -447,13 +513,50 @@ The following customizations were applied based on your requirements:
     ) -> List[str]:
         """Create all files for a single policy."""
         return self.create_policy_directory_structure(
-            policy, category_dir, validation_result
+            policy, category_dir, validation_result, create_dirs=False
         )
 
+    def _create_output_directories(
+        self, category_policies: Dict[str, List[RecommendedPolicy]]
+    ) -> Dict[str, str]:
+        """Create every category and policy directory in one batch.
+
+        Directories are deduplicated and created shallowest first, so each
+        needs a single mkdir call. Returns the directory of each category.
+        """
+        os.makedirs(self.output_directory, exist_ok=True)
+
+        category_dirs = {}
+        required_dirs = set()
+        for category, policies in category_policies.items():
+            category_dir = os.path.join(
+                self.output_directory, self._sanitize_category_name(category)
+            )
+            category_dirs[category] = category_dir
+            required_dirs.add(category_dir)
+            required_dirs.update(
+                os.path.join(
+                    category_dir, self._sanitize_policy_name(p.original_policy.name)
+                )
+                for p in policies
+            )
+
+        for directory in sorted(required_dirs, key=lambda d: d.count(os.sep)):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                # Names containing separators need their intermediate parents
+                os.makedirs(directory, exist_ok=True)
+
+        return category_dirs
+
     def _create_recommendation_summary(
         self,
         recommendation: PolicyRecommendation,
         validation_results: List[ValidationResult],
+        category_policies: Optional[Dict[str, List[RecommendedPolicy]]] = None,
     ) -> str:
         """Create high-level recommendation summary."""
         try:
@@ -462,13 +565,18 @@ The following customizations were applied based on your requirements:
             )
 
             # Calculate validation statistics
+            passed_results, failed_results, fixed_count = (
+                self._partition_validation_results(validation_results)
+            )
             validation_stats = {
                 "total": len(validation_results),
-                "passed": sum(1 for r in validation_results if r.passed),
-                "failed": sum(1 for r in validation_results if not r.passed),
-                "fixed": sum(1 for r in validation_results if r.fixed_content),
+                "passed": len(passed_results),
+                "failed": len(failed_results),
+                "fixed": fixed_count,
             }
 
+            cluster_info = recommendation.cluster_info
+            requirements = recommendation.requirements
             summary = {
                 "recommendation_metadata": {
                     "generated_at": recommendation.generation_timestamp.isoformat(),
@@ -477,46 +585,43 @@ The following customizations were applied based on your requirements:
                     "categories": recommendation.categories,
                 },
                 "cluster_information": {
-                    "kubernetes_version": recommendation.cluster_info.version,
-                    "managed_service": recommendation.cluster_info.managed_service,
-                    "node_count": recommendation.cluster_info.node_count,
-                    "namespace_count": recommendation.cluster_info.namespace_count,
+                    "kubernetes_version": cluster_info.version,
+                    "managed_service": cluster_info.managed_service,
+                    "node_count": cluster_info.node_count,
+                    "namespace_count": cluster_info.namespace_count,
                     "third_party_controllers": [
-                        {"name": ctrl.name, "type": ctrl.type.value}
-                        for ctrl in recommendation.cluster_info.third_party_controllers
+                        ctrl.to_dict() for ctrl in cluster_info.third_party_controllers
                     ],
                 },
                 "governance_requirements": {
-                    "compliance_frameworks": recommendation.requirements.compliance_frameworks,
-                    "allowed_registries": recommendation.requirements.registries,
-                    "requirements_count": len(recommendation.requirements.answers),
+                    "compliance_frameworks": requirements.compliance_frameworks,
+                    "allowed_registries": requirements.registries,
+                    "requirements_count": len(requirements.answers),
                 },
                 "validation_summary": validation_stats,
                 "policy_categories": {},
             }
 
             # Add category breakdown
-            category_policies = self._group_policies_by_category(
-                recommendation.recommended_policies, recommendation.categories
-            )
+            if category_policies is None:
+                category_policies = self._group_policies_by_category(
+                    recommendation.recommended_policies, recommendation.categories
+                )
+            passed_counts = self._count_passed_by_policy(validation_results)
 
             for category, policies in category_policies.items():
-                category_validation = [
-                    r
-                    for r in validation_results
-                    if any(p.original_policy.name == r.policy_name for p in policies)
-                ]
-
                 summary["policy_categories"][category] = {
                     "policy_count": len(policies),
-                    "validation_passed": sum(
-                        1 for r in category_validation if r.passed
+                    "validation_passed": self._count_category_passed(
+                        policies, passed_counts
                     ),
                     "policies": [p.original_policy.name for p in policies],
                 }
 
-            with open(summary_file, "w", encoding="utf-8") as f:
-                f.write(yaml.dump(summary, default_flow_style=False))
+            with open(
+                summary_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+            ) as f:
+                yaml.dump(summary, f, Dumper=SafeDumper, default_flow_style=False)
 
             return summary_file
 
@@ -539,41 +644,35 @@ The following customizations were applied based on your requirements:
         try:
             index_file = os.path.join(self.output_directory, "category-index.yaml")
 
-            index = {"categories": {}, "generated_at": datetime.now().isoformat()}
+            index = {"categories": {}, "generated_at": self._get_run_timestamp()}
+            passed_counts = self._count_passed_by_policy(validation_results)
 
             for category, policies in category_policies.items():
-                category_validation = [
-                    r
-                    for r in validation_results
-                    if any(p.original_policy.name == r.policy_name for p in policies)
-                ]
-
                 index["categories"][category] = {
                     "directory": self._sanitize_category_name(category),
                     "policy_count": len(policies),
-                    "validation_passed": sum(
-                        1 for r in category_validation if r.passed
+                    "validation_passed": self._count_category_passed(
+                        policies, passed_counts
                     ),
                     "description": self._get_category_description(category),
                     "policies": [
                         {
                             "name": p.original_policy.name,
-                            "description": (
-                                p.original_policy.description[:100] + "..."
-                                if len(p.original_policy.description) > 100
-                                else p.original_policy.description
+                            "description": self._truncate(
+                                p.original_policy.description
                             ),
-                            "validation_passed": any(
-                                r.policy_name == p.original_policy.name and r.passed
-                                for r in validation_results
+                            "validation_passed": bool(
+                                passed_counts[p.original_policy.name]
                             ),
                         }
                         for p in policies
                     ],
                 }
 
-            with open(index_file, "w", encoding="utf-8") as f:
-                f.write(yaml.dump(index, default_flow_style=False))
+            with open(
+                index_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+            ) as f:
+                yaml.dump(index, f, Dumper=SafeDumper, default_flow_style=False)
 
             return index_file
 
@@ -581,11 +680,15 @@ The following customizations were applied based on your requirements:
             self.logger.error(f"Error creating category index: {e}")
             raise FileSystemError(f"Failed to create category index: {e}")
 
-    def _sanitize_category_name(self, category: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _sanitize_category_name(category: str) -> str:
         """Sanitize category name for directory creation."""
         return category.lower().replace(" ", "-").replace("_", "-")
 
-    def _sanitize_policy_name(self, policy_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _sanitize_policy_name(policy_name: str) -> str:
         """Sanitize policy name for directory creation."""
         return policy_name.lower().replace(" ", "-").replace("_", "-")
 
@@ -762,8 +865,10 @@ The following policies have been selected for your cluster:
             summary_file = os.path.join(self.output_directory, "SUMMARY.yaml")
 
             os.makedirs(self.output_directory, exist_ok=True)
-            with open(summary_file, "w", encoding="utf-8") as f:
-                yaml.dump(summary, f, default_flow_style=False)
+            with open(
+                summary_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+            ) as f:
+                yaml.dump(summary, f, Dumper=SafeDumper, default_flow_style=False)
 
             return summary_file
         except Exception as e:
@@ -816,11 +921,14 @@ The following policies have been selected for your cluster:
             .replace(":", "-")
         )
 
+    @staticmethod
+    def _truncate(text: str, limit: int = 100) -> str:
+        """Truncate text to limit characters, marking cut text with an ellipsis."""
+        return text if len(text) <= limit else f"{text[:limit]}..."
+
     def _generate_sample_resource(self, policy: RecommendedPolicy) -> str:
         """Generate sample resource for testing the policy."""
         try:
-            # Parse policy to understand what resources it targets
-            policy_data = yaml.safe_load(policy.customized_content)
             policy_name = policy.original_policy.name
 
             # Special handling for specific policies
@@ -830,19 +938,11 @@ The following policies have been selected for your cluster:
                 return self._generate_namespace_test_resources()
 
             # Extract resource kinds from policy rules
-            resource_kinds = set()
-            rules = policy_data.get("spec", {}).get("rules", [])
-
-            for rule in rules:
-                match = rule.get("match", {})
-                if "any" in match:
-                    for any_match in match["any"]:
-                        resources = any_match.get("resources", {})
-                        kinds = resources.get("kinds", [])
-                        resource_kinds.update(kinds)
-                elif "resources" in match:
-                    kinds = match["resources"].get("kinds", [])
-                    resource_kinds.update(kinds)
+            resource_kinds = self._extract_kinds_fast(policy.customized_content)
+            if not resource_kinds:
+                # Fall back to a full parse for layouts the scan does not cover
+                policy_data = yaml.safe_load(policy.customized_content)
+                resource_kinds = self._extract_kinds_from_yaml(policy_data)
 
             # Generate sample resource for the first kind found
             if resource_kinds:
@@ -855,6 +955,52 @@ The following policies have been selected for your cluster:
             self.logger.error(f"Error generating sample resource: {e}")
             return self._generate_resource_template("Pod")
 
+    def _extract_kinds_fast(self, content: str) -> set:
+        """Extract matched resource kinds with a line scan instead of a YAML parse.
+
+        Returns an empty set when the policy has exclude or match.all blocks
+        (whose kinds must not be picked up), when some kinds key is written in
+        a form the scan does not recognize, or when no kinds list could be found.
+        """
+        if "exclude:" in content or _MATCH_ALL_PATTERN.search(content):
+            return set()
+
+        flow_lists = _KINDS_FLOW_PATTERN.findall(content)
+        blocks = _KINDS_BLOCK_PATTERN.findall(content)
+        if len(flow_lists) + len(blocks) < len(_KINDS_KEY_PATTERN.findall(content)):
+            return set()
+
+        resource_kinds = set()
+        for flow_list in flow_lists:
+            resource_kinds.update(
+                kind.strip().strip("'\"") for kind in flow_list.split(",")
+            )
+        for _, block in blocks:
+            for line in block.splitlines():
+                kind = line.strip().lstrip("-").split("#", 1)[0].strip()
+                resource_kinds.add(kind.strip("'\""))
+
+        resource_kinds.discard("")
+        return resource_kinds
+
+    def _extract_kinds_from_yaml(self, policy_data: Dict[str, Any]) -> set:
+        """Extract matched resource kinds from a parsed policy."""
+        resource_kinds = set()
+        rules = policy_data.get("spec", {}).get("rules", [])
+
+        for rule in rules:
+            match = rule.get("match", {})
+            if "any" in match:
+                for any_match in match["any"]:
+                    resources = any_match.get("resources", {})
+                    kinds = resources.get("kinds", [])
+                    resource_kinds.update(kinds)
+            elif "resources" in match:
+                kinds = match["resources"].get("kinds", [])
+                resource_kinds.update(kinds)
+
+        return resource_kinds
+
     def _generate_service_mesh_test_resources(self) -> str:
         """Generate test resources for service mesh policies."""
         return """apiVersion: v1
@@ -1058,31 +1204,44 @@ spec:
         return templates.get(kind, templates["Pod"])
 
     def _create_policy_metadata(
-        self, policy: RecommendedPolicy, validation_result: Optional[ValidationResult]
+        self,
+        policy: RecommendedPolicy,
+        validation_result: Optional[ValidationResult],
+        policy_filename: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Create metadata for a policy."""
+        original = policy.original_policy
+        if policy_filename is None:
+            policy_filename = os.path.basename(original.relative_path)
+
+        if validation_result:
+            validation = {
+                "status": validation_result.passed,
+                "errors": validation_result.errors,
+                "warnings": validation_result.warnings,
+                "automatically_fixed": bool(validation_result.fixed_content),
+            }
+        else:
+            validation = {
+                "status": "unknown",
+                "errors": [],
+                "warnings": [],
+                "automatically_fixed": False,
+            }
+
         metadata = {
-            "policy_name": policy.original_policy.name,
-            "category": policy.category or policy.original_policy.category,
-            "description": policy.original_policy.description,
-            "source_repository": policy.original_policy.source_repo,
-            "tags": policy.original_policy.tags,
+            "policy_name": original.name,
+            "category": policy.category or original.category,
+            "description": original.description,
+            "source_repository": original.source_repo,
+            "tags": original.tags,
             "customizations_applied": policy.customizations_applied,
-            "validation": {
-                "status": validation_result.passed if validation_result else "unknown",
-                "errors": validation_result.errors if validation_result else [],
-                "warnings": validation_result.warnings if validation_result else [],
-                "automatically_fixed": (
-                    bool(validation_result.fixed_content)
-                    if validation_result
-                    else False
-                ),
-            },
+            "validation": validation,
             "files": {
-                "policy": os.path.basename(policy.original_policy.relative_path),
+                "policy": policy_filename,
                 "test": (
                     "kyverno-test.yaml"
-                    if (policy.test_content or policy.original_policy.test_directory)
+                    if (policy.test_content or original.test_directory)
                     else None
                 ),
                 "sample_resource": "resource.yaml",
@@ -1093,30 +1252,17 @@ spec:
 
     def _get_category_description(self, category: str) -> str:
         """Get description for a category."""
-        descriptions = {
-            "best-practices": "General Kubernetes best practices and operational excellence policies",
-            "security": "Security-focused policies for workload and cluster protection",
-            "compliance": "Compliance framework policies for regulatory requirements",
-            "network-security": "Network security and ingress/egress control policies",
-            "resource-management": "Resource allocation and management policies",
-            "workload-security": "Workload-specific security and runtime policies",
-            "storage-management": "Storage and persistent volume management policies",
-            "security-and-compliance": "Combined security and compliance policies",
-        }
-
-        return descriptions.get(
-            category, f"Policies related to {category.replace('-', ' ')}"
+        return (
+            _CATEGORY_DESCRIPTIONS.get(category)
+            or f"Policies related to {category.replace('-', ' ')}"
         )
 
     def _generate_validation_recommendations(
-        self, validation_results: List[ValidationResult]
+        self, failed_count: int, fixed_count: int
     ) -> List[str]:
-        """Generate recommendations based on validation results."""
+        """Generate recommendations from failed and automatically fixed counts."""
         recommendations = []
 
-        failed_count = sum(1 for r in validation_results if not r.passed)
-        fixed_count = sum(1 for r in validation_results if r.fixed_content)
-
         if failed_count > 0:
             recommendations.append(
                 f"{failed_count} policies failed validation - review errors before deployment"
@@ -3,11 +3,161 @@ AI-powered test case generation for Kyverno policies.
 Generates comprehensive test cases for policies that are missing tests.
 """
 
+import hashlib
 import yaml
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Iterator, Set
 from ai.bedrock_client import BedrockClient
 from exceptions import AISelectionError
+from utils.yaml_utils import SafeLoader, SafeDumper
+
+# Prompt templates, filled in with str.format for each request
+_ENHANCE_TEST_PROMPT = """
+You are a Kyverno testing expert. Enhance the following existing test case by adding more comprehensive test scenarios.
+
+EXISTING TEST CASE:
+{existing_test}
+
+POLICY BEING TESTED:
+{policy_content}
+
+INSTRUCTIONS:
+1. Keep all existing test scenarios
+2. Add additional edge cases and boundary conditions
+3. Ensure both positive and negative test scenarios are covered
+4. Add tests for different resource variations if applicable
+5. Maintain proper Kyverno test format
+6. Return only the enhanced YAML test content
+
+ENHANCED TEST CASE:
+"""
+
+_AI_TEST_PROMPT = """
+You are a Kyverno testing expert. Create a comprehensive test case for the following Kyverno policy.
+
+POLICY NAME: {policy_name}
+POLICY RULES: {rule_names}
+TARGET RESOURCES: {resource_kinds}
+
+POLICY CONTENT:
+{policy_content}
+
+INSTRUCTIONS:
+1. Create a kyverno-test.yaml file with comprehensive test scenarios
+2. Include both positive tests (resources that should pass) and negative tests (resources that should fail)
+3. Test all rules in the policy if possible
+4. Use realistic resource examples that would be found in production
+5. Include edge cases and boundary conditions
+6. Follow proper Kyverno test format with apiVersion, kind, metadata, policies, resources, and results sections
+7. Use the new Kyverno test format: apiVersion: cli.kyverno.io/v1alpha1, kind: Test
+8. Reference resource files that will exist (like resource.yaml)
+9. Ensure test resource names match the expected results
+10. For service mesh policies, include containers with appropriate security contexts
+11. Return only the YAML test content, no explanations
+
+TEST CASE:
+"""
+
+# Markdown code fences models wrap YAML answers in, e.g. "```yaml ... ```"
+_CODE_FENCE_PATTERN = re.compile(r"^```(?:ya?ml)?|```$", re.IGNORECASE)
+
+# Top-level keys shared by the new and legacy Kyverno test formats
+_REQUIRED_TEST_KEYS = ("policies", "resources", "results")
+_NEW_FORMAT_TEST_FIELDS = frozenset(("metadata",) + _REQUIRED_TEST_KEYS)
+_LEGACY_FORMAT_TEST_FIELDS = frozenset(("name",) + _REQUIRED_TEST_KEYS)
+_REQUIRED_RESULT_FIELDS = frozenset(("policy", "rule", "result"))
+
+
+def _pod_template() -> Dict[str, Any]:
+    """Build the base Pod for generated tests."""
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": "test-pod",
+            "namespace": "default",
+            "labels": {"app": "test"},
+        },
+        "spec": {
+            "containers": [
+                {
+                    "name": "test-container",
+                    "image": "nginx:latest",
+                    "resources": {
+                        "requests": {"memory": "64Mi", "cpu": "250m"},
+                        "limits": {"memory": "128Mi", "cpu": "500m"},
+                    },
+                }
+            ]
+        },
+    }
+
+
+def _deployment_template() -> Dict[str, Any]:
+    """Build the base Deployment for generated tests."""
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {
+            "name": "test-deployment",
+            "namespace": "default",
+            "labels": {"app": "test"},
+        },
+        "spec": {
+            "replicas": 1,
+            "selector": {"matchLabels": {"app": "test"}},
+            "template": {
+                "metadata": {"labels": {"app": "test"}},
+                "spec": {
+                    "containers": [
+                        {
+                            "name": "test-container",
+                            "image": "nginx:latest",
+                            "resources": {
+                                "requests": {"memory": "64Mi", "cpu": "250m"},
+                                "limits": {"memory": "128Mi", "cpu": "500m"},
+                            },
+                        }
+                    ]
+                },
+            },
+        },
+    }
+
+
+def _service_template() -> Dict[str, Any]:
+    """Build the base Service for generated tests."""
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": "test-service", "namespace": "default"},
+        "spec": {
+            "selector": {"app": "test"},
+            "ports": [{"port": 80, "targetPort": 8080}],
+            "type": "ClusterIP",
+        },
+    }
+
+
+# Builders for the base resources of generated tests; each call returns a
+# fresh dict the caller can mutate
+_BASE_RESOURCE_BUILDERS = {
+    "Pod": _pod_template,
+    "Deployment": _deployment_template,
+    "Service": _service_template,
+}
+
+
+@lru_cache(maxsize=256)
+def _load_policy(policy_content: str) -> Any:
+    """Parse policy YAML, reusing the result for repeated content.
+
+    The returned data is shared between callers and must not be mutated.
+    """
+    return yaml.load(policy_content, Loader=SafeLoader)
 
 
 class TestCaseGenerator:
@@ -17,6 +167,11 @@ class TestCaseGenerator:
         """Initialize test case generator."""
         self.bedrock_client = bedrock_client
         self.logger = logging.getLogger(__name__)
+        # Validated AI responses keyed by prompt digest, reused for repeat prompts
+        self._response_cache: Dict[str, str] = {}
+        # Digests of prompts whose AI answer was unusable; these go straight
+        # to the template fallback instead of another round trip
+        self._rejected_prompts: Set[str] = set()
 
     def generate_comprehensive_test_case(
         self, policy_content: str, policy_name: str
@@ -24,7 +179,7 @@ class TestCaseGenerator:
         """Generate comprehensive test case with positive and negative scenarios."""
         try:
             # Parse policy to understand its structure
-            policy_data = yaml.safe_load(policy_content)
+            policy_data = _load_policy(policy_content)
 
             if not policy_data or policy_data.get("kind") not in [
                 "ClusterPolicy",
@@ -32,33 +187,70 @@ class TestCaseGenerator:
             ]:
                 raise AISelectionError("Invalid policy format for test generation")
 
+            # Both generators target the same rules and resource kinds,
+            # collect them once
+            rule_names = self._extract_rule_names(policy_data)
+            resource_kinds = self._extract_resource_kinds(policy_data)
+
             # Use AI to generate comprehensive test case
             ai_test = self._generate_ai_test_case(
-                policy_content, policy_data, policy_name
+                policy_content, policy_data, policy_name, resource_kinds, rule_names
             )
 
+            # AI test cases are validated before they are returned
             if ai_test:
-                # Validate the generated test case
-                if self._validate_test_case_format(ai_test):
-                    return ai_test
-                else:
-                    self.logger.warning(
-                        f"AI-generated test case for {policy_name} has invalid format, using template"
-                    )
+                return ai_test
 
             # Fallback to template-based generation
-            return self._generate_template_test_case(policy_data, policy_name)
+            return self._generate_template_test_case(
+                policy_data, policy_name, resource_kinds, rule_names
+            )
 
         except Exception as e:
             self.logger.error(f"Error generating test case for {policy_name}: {e}")
             return self._generate_minimal_test_case(policy_name)
 
+    def generate_test_cases_batch(
+        self, policies: Dict[str, str], max_workers: int = 8
+    ) -> Dict[str, str]:
+        """Generate test cases for many policies with concurrent AI requests.
+
+        Takes a mapping of policy name to policy content and returns a mapping
+        of policy name to test case. Bedrock requests are I/O bound, so they are
+        issued from a thread pool instead of one after another. A policy whose
+        generation fails gets a minimal test case without affecting the others.
+        """
+        if not policies:
+            return {}
+
+        workers = max(1, min(max_workers, len(policies)))
+        test_cases = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                policy_name: executor.submit(
+                    self.generate_comprehensive_test_case, policy_content, policy_name
+                )
+                for policy_name, policy_content in policies.items()
+            }
+            for policy_name, future in futures.items():
+                try:
+                    test_cases[policy_name] = future.result()
+                except Exception as e:
+                    self.logger.error(
+                        f"Error generating test case for {policy_name}: {e}"
+                    )
+                    test_cases[policy_name] = self._generate_minimal_test_case(
+                        policy_name
+                    )
+
+        return test_cases
+
     def generate_test_resources(
         self, policy_content: str, policy_name: str
     ) -> List[Dict[str, Any]]:
         """Generate test resources that should pass and fail the policy."""
         try:
-            policy_data = yaml.safe_load(policy_content)
+            policy_data = _load_policy(policy_content)
 
             # Extract resource types and constraints from policy
             resource_info = self._extract_resource_info(policy_data)
@@ -107,25 +299,14 @@ class TestCaseGenerator:
             if not self.bedrock_client:
                 return existing_test
 
-            prompt = f"""
-You are a Kyverno testing expert. Enhance the following existing test case by adding more comprehensive test scenarios.
-
-EXISTING TEST CASE:
-{existing_test}
-
-POLICY BEING TESTED:
-{policy_content}
-
-INSTRUCTIONS:
-1. Keep all existing test scenarios
-2. Add additional edge cases and boundary conditions
-3. Ensure both positive and negative test scenarios are covered
-4. Add tests for different resource variations if applicable
-5. Maintain proper Kyverno test format
-6. Return only the enhanced YAML test content
+            prompt = _ENHANCE_TEST_PROMPT.format(
+                existing_test=existing_test, policy_content=policy_content
+            )
 
-ENHANCED TEST CASE:
-"""
+            cache_key = self._prompt_cache_key(prompt)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
             response = self.bedrock_client.send_request(
                 prompt, max_tokens=2500, temperature=0.2
@@ -133,6 +314,7 @@ ENHANCED TEST CASE:
 
             # Validate the enhanced test case
             if self._validate_test_case_format(response):
+                self._response_cache[cache_key] = response
                 return response
             else:
                 self.logger.warning(
@@ -145,123 +327,98 @@ ENHANCED TEST CASE:
             return existing_test
 
     def _generate_ai_test_case(
-        self, policy_content: str, policy_data: Dict[str, Any], policy_name: str
+        self,
+        policy_content: str,
+        policy_data: Dict[str, Any],
+        policy_name: str,
+        resource_kinds: Optional[Set[str]] = None,
+        rule_names: Optional[List[str]] = None,
     ) -> Optional[str]:
         """Use AI to generate comprehensive test case."""
         try:
             # Extract key information about the policy
-            rules = policy_data.get("spec", {}).get("rules", [])
-            rule_names = [
-                rule.get("name", f"rule-{i+1}") for i, rule in enumerate(rules)
-            ]
+            if rule_names is None:
+                rule_names = self._extract_rule_names(policy_data)
 
             # Determine resource kinds
-            resource_kinds = set()
-            for rule in rules:
-                match = rule.get("match", {})
-                if "any" in match:
-                    for any_match in match["any"]:
-                        resources = any_match.get("resources", {})
-                        kinds = resources.get("kinds", [])
-                        resource_kinds.update(kinds)
-                elif "resources" in match:
-                    kinds = match["resources"].get("kinds", [])
-                    resource_kinds.update(kinds)
-
-            if not resource_kinds:
-                resource_kinds = {"Pod"}  # Default fallback
-
-            prompt = f"""
-You are a Kyverno testing expert. Create a comprehensive test case for the following Kyverno policy.
-
-POLICY NAME: {policy_name}
-POLICY RULES: {', '.join(rule_names)}
-TARGET RESOURCES: {', '.join(resource_kinds)}
-
-POLICY CONTENT:
-{policy_content}
-
-INSTRUCTIONS:
-1. Create a kyverno-test.yaml file with comprehensive test scenarios
-2. Include both positive tests (resources that should pass) and negative tests (resources that should fail)
-3. Test all rules in the policy if possible
-4. Use realistic resource examples that would be found in production
-5. Include edge cases and boundary conditions
-6. Follow proper Kyverno test format with apiVersion, kind, metadata, policies, resources, and results sections
-7. Use the new Kyverno test format: apiVersion: cli.kyverno.io/v1alpha1, kind: Test
-8. Reference resource files that will exist (like resource.yaml)
-9. Ensure test resource names match the expected results
-10. For service mesh policies, include containers with appropriate security contexts
-11. Return only the YAML test content, no explanations
+            if resource_kinds is None:
+                resource_kinds = self._extract_resource_kinds(policy_data)
+
+            prompt = _AI_TEST_PROMPT.format(
+                policy_name=policy_name,
+                rule_names=", ".join(rule_names),
+                resource_kinds=", ".join(resource_kinds),
+                policy_content=policy_content,
+            )
 
-TEST CASE:
-"""
+            cache_key = self._prompt_cache_key(prompt)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            if cache_key in self._rejected_prompts:
+                return None
 
             response = self.bedrock_client.send_request(
                 prompt, max_tokens=3000, temperature=0.2
             )
 
             # Clean up the response - remove markdown code blocks
-            response = response.strip()
-            if response.startswith("```yaml"):
-                response = response[7:]  # Remove ```yaml
-            if response.startswith("```"):
-                response = response[3:]  # Remove ```
-            if response.endswith("```"):
-                response = response[:-3]  # Remove trailing ```
-            response = response.strip()
+            response = _CODE_FENCE_PATTERN.sub("", response.strip()).strip()
 
             # Validate YAML format
             try:
-                # Handle multiple documents - take only the first one for test case
-                documents = list(yaml.safe_load_all(response))
-                if documents:
-                    test_data = documents[0]  # Use first document as test case
-                    test_yaml = yaml.dump(test_data, default_flow_style=False)
-
+                # Handle multiple documents - only the first one is the test case,
+                # so later documents are never parsed
+                test_data = next(yaml.load_all(response, Loader=SafeLoader), None)
+                if test_data is not None:
                     # Ensure it has the correct structure
-                    if self._validate_test_case_format(test_yaml):
+                    if self._validate_test_case_data(test_data):
+                        test_yaml = yaml.dump(
+                            test_data, Dumper=SafeDumper, default_flow_style=False
+                        )
+                        self._response_cache[cache_key] = test_yaml
                         return test_yaml
                     else:
                         self.logger.warning(
                             f"AI-generated test case for {policy_name} has invalid format"
                         )
+                        self._rejected_prompts.add(cache_key)
                         return None
                 else:
                     self.logger.warning(
                         f"AI-generated test case for {policy_name} is empty"
                     )
+                    self._rejected_prompts.add(cache_key)
                     return None
             except yaml.YAMLError as e:
                 self.logger.warning(f"AI-generated test case has invalid YAML: {e}")
+                self._rejected_prompts.add(cache_key)
                 return None
 
         except Exception as e:
             self.logger.error(f"Error generating AI test case: {e}")
             return None
 
+    @staticmethod
+    def _prompt_cache_key(prompt: str) -> str:
+        """Digest a prompt for the response cache."""
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
     def _generate_template_test_case(
-        self, policy_data: Dict[str, Any], policy_name: str
+        self,
+        policy_data: Dict[str, Any],
+        policy_name: str,
+        resource_kinds: Optional[Set[str]] = None,
+        rule_names: Optional[List[str]] = None,
     ) -> str:
         """Generate template-based test case."""
         try:
-            rules = policy_data.get("spec", {}).get("rules", [])
+            if rule_names is None:
+                rule_names = self._extract_rule_names(policy_data)
 
             # Extract resource kinds
-            resource_kinds = set()
-            for rule in rules:
-                match = rule.get("match", {})
-                if "any" in match:
-                    for any_match in match["any"]:
-                        resources = any_match.get("resources", {})
-                        kinds = resources.get("kinds", [])
-                        resource_kinds.update(kinds)
-                elif "resources" in match:
-                    kinds = match["resources"].get("kinds", [])
-                    resource_kinds.update(kinds)
-
-            if not resource_kinds:
-                resource_kinds = {"Pod"}
+            if resource_kinds is None:
+                resource_kinds = self._extract_resource_kinds(policy_data)
 
             # Create test structure using new Kyverno test format
             test_case = {
@@ -273,34 +430,39 @@ TEST CASE:
                 "results": [],
             }
 
-            # Add results for each rule and resource kind
-            for i, rule in enumerate(rules):
-                rule_name = rule.get("name", f"rule-{i+1}")
+            # Resource names only depend on the kind, not on the rule
+            kind_resources = [
+                (kind, f"good-{kind.lower()}", f"bad-{kind.lower()}")
+                for kind in resource_kinds
+            ]
 
-                for kind in resource_kinds:
+            # Add results for each rule and resource kind
+            results = test_case["results"]
+            for rule_name in rule_names:
+                for kind, good_resource, bad_resource in kind_resources:
                     # Good resource test
-                    test_case["results"].append(
+                    results.append(
                         {
                             "policy": policy_name,
                             "rule": rule_name,
-                            "resource": f"good-{kind.lower()}",
+                            "resource": good_resource,
                             "kind": kind,
                             "result": "pass",
                         }
                     )
 
                     # Bad resource test
-                    test_case["results"].append(
+                    results.append(
                         {
                             "policy": policy_name,
                             "rule": rule_name,
-                            "resource": f"bad-{kind.lower()}",
+                            "resource": bad_resource,
                             "kind": kind,
                             "result": "fail",
                         }
                     )
 
-            return yaml.dump(test_case, default_flow_style=False)
+            return yaml.dump(test_case, Dumper=SafeDumper, default_flow_style=False)
 
         except Exception as e:
             self.logger.error(f"Error generating template test case: {e}")
@@ -325,14 +487,30 @@ TEST CASE:
             ],
         }
 
-        return yaml.dump(test_case, default_flow_style=False)
+        return yaml.dump(test_case, Dumper=SafeDumper, default_flow_style=False)
 
     def _validate_test_case_format(self, test_content: str) -> bool:
         """Validate test case format."""
+        # Every accepted format needs these keys, so text lacking any of them
+        # (e.g. a prose answer) can be rejected without parsing it
+        if not isinstance(test_content, str) or not all(
+            key in test_content for key in _REQUIRED_TEST_KEYS
+        ):
+            return False
+
         try:
-            test_data = yaml.safe_load(test_content)
+            return self._validate_test_case_data(
+                yaml.load(test_content, Loader=SafeLoader)
+            )
+        except yaml.YAMLError:
+            return False
+        except Exception:
+            return False
 
-            if not test_data:
+    def _validate_test_case_data(self, test_data: Any) -> bool:
+        """Validate an already parsed test case."""
+        try:
+            if not test_data or not isinstance(test_data, dict):
                 return False
 
             # Check for new Kyverno test format
@@ -341,32 +519,25 @@ TEST CASE:
                 and test_data.get("kind") == "Test"
             ):
                 # New format validation
-                required_fields = ["metadata", "policies", "resources", "results"]
-                for field in required_fields:
-                    if field not in test_data:
-                        return False
+                if not test_data.keys() >= _NEW_FORMAT_TEST_FIELDS:
+                    return False
 
                 # Check metadata has name
-                if not test_data.get("metadata", {}).get("name"):
+                if not test_data["metadata"].get("name"):
                     return False
             else:
                 # Legacy format validation
-                required_fields = ["name", "policies", "resources", "results"]
-                for field in required_fields:
-                    if field not in test_data:
-                        return False
+                if not test_data.keys() >= _LEGACY_FORMAT_TEST_FIELDS:
+                    return False
 
             # Validate results structure
-            results = test_data.get("results", [])
-            for result in results:
+            for result in test_data["results"]:
                 if not isinstance(result, dict):
                     return False
 
                 # Check for either old format (resource) or new format (resources)
-                required_result_fields = ["policy", "rule", "result"]
-                for field in required_result_fields:
-                    if field not in result:
-                        return False
+                if not result.keys() >= _REQUIRED_RESULT_FIELDS:
+                    return False
 
                 # Must have either 'resource' or 'resources' field
                 if "resource" not in result and "resources" not in result:
@@ -374,8 +545,6 @@ TEST CASE:
 
             return True
 
-        except yaml.YAMLError:
-            return False
         except Exception:
             return False
 
@@ -389,17 +558,8 @@ TEST CASE:
             "annotations": {},
         }
 
-        rules = policy_data.get("spec", {}).get("rules", [])
-
-        for rule in rules:
-            match = rule.get("match", {})
-
-            # Handle 'any' matches
-            if "any" in match:
-                for any_match in match["any"]:
-                    self._extract_match_info(any_match, info)
-            else:
-                self._extract_match_info(match, info)
+        for resources in self._iter_match_resources(policy_data):
+            self._extract_match_info(resources, info)
 
         # Convert sets to lists for JSON serialization
         info["kinds"] = list(info["kinds"]) if info["kinds"] else ["Pod"]
@@ -408,10 +568,35 @@ TEST CASE:
 
         return info
 
-    def _extract_match_info(self, match: Dict[str, Any], info: Dict[str, Any]) -> None:
-        """Extract match information from a match block."""
-        resources = match.get("resources", {})
+    def _iter_match_resources(
+        self, policy_data: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the resources block of every match clause in the policy rules."""
+        for rule in policy_data.get("spec", {}).get("rules", []):
+            match = rule.get("match", {})
+
+            # Handle 'any' matches
+            match_blocks = match["any"] if "any" in match else [match]
+            for match_block in match_blocks:
+                yield match_block.get("resources", {})
 
+    def _extract_rule_names(self, policy_data: Dict[str, Any]) -> List[str]:
+        """List the policy rule names, numbering unnamed rules."""
+        rules = policy_data.get("spec", {}).get("rules", [])
+        return [rule.get("name", f"rule-{i+1}") for i, rule in enumerate(rules)]
+
+    def _extract_resource_kinds(self, policy_data: Dict[str, Any]) -> Set[str]:
+        """Collect the resource kinds matched by the policy, defaulting to Pod."""
+        resource_kinds = set()
+        for resources in self._iter_match_resources(policy_data):
+            resource_kinds.update(resources.get("kinds", []))
+
+        return resource_kinds or {"Pod"}
+
+    def _extract_match_info(
+        self, resources: Dict[str, Any], info: Dict[str, Any]
+    ) -> None:
+        """Extract match information from a match resources block."""
         # Extract kinds
         kinds = resources.get("kinds", [])
         info["kinds"].update(kinds)
@@ -438,6 +623,7 @@ TEST CASE:
         """Generate a resource that should pass the policy."""
         try:
             base_resource = self._get_base_resource_template(resource_type)
+            metadata = base_resource.setdefault("metadata", {})
 
             # Apply constraints that would make it pass
             # This is a simplified implementation - in practice, you'd analyze the policy rules
@@ -445,21 +631,13 @@ TEST CASE:
 
             # Add required labels if specified
             if resource_info["labels"]:
-                if "metadata" not in base_resource:
-                    base_resource["metadata"] = {}
-                if "labels" not in base_resource["metadata"]:
-                    base_resource["metadata"]["labels"] = {}
-                base_resource["metadata"]["labels"].update(resource_info["labels"])
+                metadata.setdefault("labels", {}).update(resource_info["labels"])
 
             # Set namespace if specified
             if resource_info["namespaces"]:
-                if "metadata" not in base_resource:
-                    base_resource["metadata"] = {}
-                base_resource["metadata"]["namespace"] = list(
-                    resource_info["namespaces"]
-                )[0]
+                metadata["namespace"] = next(iter(resource_info["namespaces"]))
 
-            base_resource["metadata"]["name"] = f"good-{resource_type.lower()}"
+            metadata["name"] = f"good-{resource_type.lower()}"
 
             return base_resource
 
@@ -495,66 +673,4 @@ TEST CASE:
 
     def _get_base_resource_template(self, resource_type: str) -> Dict[str, Any]:
         """Get base resource template for the given type."""
-        templates = {
-            "Pod": {
-                "apiVersion": "v1",
-                "kind": "Pod",
-                "metadata": {
-                    "name": "test-pod",
-                    "namespace": "default",
-                    "labels": {"app": "test"},
-                },
-                "spec": {
-                    "containers": [
-                        {
-                            "name": "test-container",
-                            "image": "nginx:latest",
-                            "resources": {
-                                "requests": {"memory": "64Mi", "cpu": "250m"},
-                                "limits": {"memory": "128Mi", "cpu": "500m"},
-                            },
-                        }
-                    ]
-                },
-            },
-            "Deployment": {
-                "apiVersion": "apps/v1",
-                "kind": "Deployment",
-                "metadata": {
-                    "name": "test-deployment",
-                    "namespace": "default",
-                    "labels": {"app": "test"},
-                },
-                "spec": {
-                    "replicas": 1,
-                    "selector": {"matchLabels": {"app": "test"}},
-                    "template": {
-                        "metadata": {"labels": {"app": "test"}},
-                        "spec": {
-                            "containers": [
-                                {
-                                    "name": "test-container",
-                                    "image": "nginx:latest",
-                                    "resources": {
-                                        "requests": {"memory": "64Mi", "cpu": "250m"},
-                                        "limits": {"memory": "128Mi", "cpu": "500m"},
-                                    },
-                                }
-                            ]
-                        },
-                    },
-                },
-            },
-            "Service": {
-                "apiVersion": "v1",
-                "kind": "Service",
-                "metadata": {"name": "test-service", "namespace": "default"},
-                "spec": {
-                    "selector": {"app": "test"},
-                    "ports": [{"port": 80, "targetPort": 8080}],
-                    "type": "ClusterIP",
-                },
-            },
-        }
-
-        return templates.get(resource_type, templates["Pod"])
+        return _BASE_RESOURCE_BUILDERS.get(resource_type, _pod_template)()
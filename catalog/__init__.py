@@ -1,12 +1,19 @@
 """
 Policy catalog management module for AEGIS.
 Handles GitHub repository processing and policy indexing.
+
+Submodules are imported lazily on first attribute access so that importing
+the package does not pay for modules the caller never uses.
 """
 
-from .catalog_manager import PolicyCatalogManager
-from .github_processor import GitHubProcessor
-from .policy_indexer import PolicyIndexer
-from .policy_retriever import PolicyRetriever
+import importlib
+
+_LAZY = {
+    "PolicyCatalogManager": ".catalog_manager",
+    "GitHubProcessor": ".github_processor",
+    "PolicyIndexer": ".policy_indexer",
+    "PolicyRetriever": ".policy_retriever",
+}
 
 __all__ = [
     "PolicyCatalogManager",
@@ -14,3 +21,16 @@ __all__ = [
     "PolicyIndexer",
     "PolicyRetriever",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
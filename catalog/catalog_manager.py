@@ -3,12 +3,18 @@ Policy Catalog Manager for AEGIS.
 Manages policy catalog creation from GitHub repositories and provides indexing functionality.
 """
 
+import hashlib
+import mmap
 import os
+import re
+import shutil
 import subprocess
 import tempfile
-import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 
 from models import PolicyIndex, PolicyCatalogEntry
@@ -20,6 +26,90 @@ from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Matches a line ending in "kind: ClusterPolicy", like grep's "kind: ClusterPolicy$"
+_CLUSTER_POLICY_KIND = re.compile(rb"kind: ClusterPolicy\r?$", re.MULTILINE)
+_MIN_POLICY_FILE_SIZE = len(b"kind: ClusterPolicy")
+# Policy files at least this large are scanned through mmap instead of read()
+_MMAP_THRESHOLD = 4096
+
+# Non-policy files that live next to policies in the catalog
+_SKIPPED_FILENAMES = frozenset(("kyverno-test.yaml", "resource.yaml", "resources.yaml"))
+_SKIPPED_SUFFIXES = ("-test.yaml", "-bad.yaml", "-good.yaml")
+
+# Common category mappings, checked in order for each path component
+_PATH_CATEGORY_KEYWORDS = {
+    "best-practices": ["best-practices", "best_practices", "bestpractices"],
+    "security": ["security", "sec"],
+    "compliance": ["compliance", "cis", "nist", "pci", "hipaa"],
+    "networking": ["networking", "network", "ingress", "service"],
+    "storage": ["storage", "pv", "pvc", "volume"],
+    "rbac": ["rbac", "role", "rolebinding", "serviceaccount"],
+    "pod-security": ["pod-security", "podsecurity", "pss"],
+    "resource-management": ["resources", "limits", "requests", "quota"],
+    "workload": ["workload", "deployment", "pod", "job"],
+}
+_PATH_CATEGORY_PATTERNS = tuple(
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in _PATH_CATEGORY_KEYWORDS.items()
+)
+
+
+def _split_owner_repo(url: str) -> Optional[Tuple[str, str]]:
+    """Return the last two path segments of a Git URL as (owner, repo)."""
+    # Handle both https and git URLs
+    if url.endswith(".git"):
+        url = url[:-4]
+
+    rest, sep, repo = url.rstrip("/").rpartition("/")
+    if not sep:
+        return None
+    return rest.rpartition("/")[2], repo
+
+
+def _normalize_sparse_paths(sparse_paths: Any) -> Optional[List[str]]:
+    """Return configured sparse_paths as a list, accepting a single path string."""
+    if not sparse_paths:
+        return None
+    if isinstance(sparse_paths, str):
+        return [sparse_paths]
+    if isinstance(sparse_paths, (list, tuple)) and all(
+        isinstance(path, str) for path in sparse_paths
+    ):
+        return list(sparse_paths)
+    raise CatalogError(
+        "Invalid sparse_paths", f"expected a list of paths, got {sparse_paths!r}"
+    )
+
+
+@lru_cache(maxsize=1024)
+def _category_for_path_part(part: str) -> Optional[str]:
+    """Return the first category whose keywords occur in a path component."""
+    for category, pattern in _PATH_CATEGORY_PATTERNS:
+        if pattern.search(part):
+            return category
+    return None
+
+
+# Files whose presence marks a policy directory as having tests
+_TEST_FILENAMES = frozenset(
+    ("kyverno-test.yaml", "resource.yaml", "resources.yaml", "values.yaml")
+)
+
+# Git invocation for commands that talk to the remote, including checkouts in
+# blobless clones, which fetch missing blobs on demand; protocol v2 lets the
+# server skip advertising refs we never ask for (default only since git 2.26)
+_GIT_NETWORK_COMMAND = ("git", "-c", "protocol.version=2")
+
+# Records the url, branch and sparse_paths a cached clone was checked out with
+_CACHE_STATE_FILE = os.path.join(".git", "aegis-cache.json")
+
+# Catalogs at least this large are indexed on a process pool
+_PARALLEL_INDEX_THRESHOLD = 500
+_INDEX_CHUNK_SIZE = 32
+
+# Substrings any document accepted by _is_valid_kyverno_policy must contain
+_POLICY_MARKERS = ("kyverno.io/", "Policy", "rules")
+
 
 class PolicyCatalogManager(PolicyCatalogInterface):
     """Main policy catalog management class."""
@@ -36,6 +126,15 @@ class PolicyCatalogManager(PolicyCatalogInterface):
         self.index_file = self.catalog_config.get("index_file", default_index_file)
         self.repositories = self.catalog_config.get("repositories", [])
 
+        # Optional persistent clone cache; clones are refreshed with git fetch
+        self.repo_cache = self.catalog_config.get("repo_cache")
+        self.repo_cache_ttl = self.catalog_config.get("repo_cache_ttl", 600)
+
+        # Loaded index and name lookup, reused until the index file changes
+        self._cached_index: Optional[PolicyIndex] = None
+        self._cached_index_mtime: Optional[float] = None
+        self._policy_lookup: Optional[Dict[str, PolicyCatalogEntry]] = None
+
         # Ensure directories exist
         FileUtils.ensure_directory(self.local_storage)
         FileUtils.ensure_directory(os.path.dirname(self.index_file))
@@ -56,38 +155,63 @@ class PolicyCatalogManager(PolicyCatalogInterface):
             # Clean up existing catalog
             self._cleanup_existing_catalog()
 
-            # Process each repository
-            source_dirs = []
+            # Resolve (url, branch, sparse_paths) for each repository
+            repo_targets = []
+            seen_targets = set()
             for repo_config in repos_to_process:
                 if isinstance(repo_config, str):
                     # Simple URL string
-                    repo_dir = self._clone_repository(repo_config, "main")
+                    target = (repo_config, "main", None)
                 else:
-                    # Dictionary with url and branch
-                    url = repo_config.get("url")
-                    branch = repo_config.get("branch", "main")
-                    repo_dir = self._clone_repository(url, branch)
-
-                if repo_dir:
-                    source_dirs.append(repo_dir)
+                    # Dictionary with url, branch and optional sparse_paths
+                    target = (
+                        repo_config.get("url"),
+                        repo_config.get("branch", "main"),
+                        _normalize_sparse_paths(repo_config.get("sparse_paths")),
+                    )
 
-            # Process policies from cloned repositories with repo info
-            repo_info = {}
-            for i, repo_config in enumerate(repos_to_process):
-                if isinstance(repo_config, str):
-                    repo_url = repo_config
-                else:
-                    repo_url = repo_config.get("url")
+                # A repeated url/branch would clone twice into the same directory
+                if target[:2] in seen_targets:
+                    logger.warning(
+                        f"Skipping duplicate repository {target[0]} (branch: {target[1]})"
+                    )
+                    continue
+                seen_targets.add(target[:2])
+                repo_targets.append(target)
 
-                if i < len(source_dirs):
-                    repo_info[source_dirs[i]] = (
-                        repo_url  # Store full HTTPS URL for GitLab/GitHub/etc support
+            # Clone repositories in parallel; clones are network-bound
+            max_workers = max(
+                1,
+                min(self.catalog_config.get("clone_workers", 8), len(repo_targets)),
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    (
+                        url,
+                        executor.submit(
+                            self._clone_repository, url, branch, sparse_paths
+                        ),
                     )
+                    for url, branch, sparse_paths in repo_targets
+                ]
+
+                # Collect in configured order so later repositories still win
+                source_dirs = []
+                repo_info = {}
+                for url, future in futures:
+                    repo_dir = future.result()
+                    if repo_dir:
+                        source_dirs.append(repo_dir)
+                        # Store full HTTPS URL for GitLab/GitHub/etc support
+                        repo_info[repo_dir] = url
+
+            # Process policies from cloned repositories with repo info
 
             self._process_policy_repositories(source_dirs, repo_info)
 
-            # Clean up cloned repositories
-            self._cleanup_cloned_repos(source_dirs)
+            # Clean up cloned repositories unless they are kept as a cache
+            if not self.repo_cache:
+                self._cleanup_cloned_repos(source_dirs)
 
             logger.info(f"Policy catalog created successfully at {self.local_storage}")
 
@@ -107,39 +231,14 @@ class PolicyCatalogManager(PolicyCatalogInterface):
 
             policy_index = PolicyIndex()
 
-            # Find all policy files in the catalog
-            policy_files = FileUtils.list_files(
-                self.local_storage, "*.yaml", recursive=True
-            )
-
-            for policy_file in policy_files:
-                try:
-                    # Skip test files and resource files
-                    filename = os.path.basename(policy_file)
-                    if (
-                        filename
-                        in ["kyverno-test.yaml", "resource.yaml", "resources.yaml"]
-                        or filename.startswith("test-")
-                        or filename.endswith("-test.yaml")
-                        or ".chainsaw-test" in policy_file
-                        or filename.endswith("-bad.yaml")
-                        or filename.endswith("-good.yaml")
-                    ):
-                        continue
-
-                    policy_entry = self._create_policy_entry(policy_file)
-                    if policy_entry:
-                        category = policy_entry.category
-                        if category not in policy_index.categories:
-                            policy_index.categories[category] = []
-                        policy_index.categories[category].append(policy_entry)
-                        policy_index.total_policies += 1
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to process policy file {policy_file}: {str(e)}"
-                    )
-                    continue
+            policy_files = list(self._iter_policy_files(self.local_storage))
+            for policy_entry in self._create_policy_entries(policy_files):
+                if policy_entry:
+                    category = policy_entry.category
+                    if category not in policy_index.categories:
+                        policy_index.categories[category] = []
+                    policy_index.categories[category].append(policy_entry)
+                    policy_index.total_policies += 1
 
             # Sort policies within each category by name for consistent ordering
             for category in policy_index.categories:
@@ -171,19 +270,16 @@ class PolicyCatalogManager(PolicyCatalogInterface):
                     "Policy index not found. Please build the catalog first."
                 )
 
-            lightweight_policies = []
-
-            for category, policies in policy_index.categories.items():
-                for policy in policies:
-                    lightweight_policies.append(
-                        {
-                            "name": policy.name,
-                            "category": policy.category,
-                            "tags": policy.tags[
-                                :5
-                            ],  # Limit tags for lightweight processing
-                        }
-                    )
+            lightweight_policies = [
+                {
+                    "name": policy.name,
+                    "category": policy.category,
+                    # Limit tags for lightweight processing
+                    "tags": policy.tags[:5],
+                }
+                for policies in policy_index.categories.values()
+                for policy in policies
+            ]
 
             logger.info(
                 f"Retrieved {len(lightweight_policies)} policies with lightweight metadata"
@@ -209,25 +305,14 @@ class PolicyCatalogManager(PolicyCatalogInterface):
                 )
 
             detailed_policies = []
-
-            # Create a lookup map for faster searching
-            policy_lookup = {}
-            for category, policies in policy_index.categories.items():
-                for policy in policies:
-                    policy_lookup[policy.name] = policy
+            policy_lookup = self._get_policy_lookup(policy_index)
 
             for policy_name in policy_names:
                 if policy_name in policy_lookup:
                     policy = policy_lookup[policy_name]
                     detailed_policies.append(
                         {
-                            "name": policy.name,
-                            "category": policy.category,
-                            "description": policy.description,
-                            "relative_path": policy.relative_path,
-                            "test_directory": policy.test_directory,
-                            "source_repo": policy.source_repo,
-                            "tags": policy.tags,
+                            **policy.to_dict(),
                             "has_tests": policy.test_directory is not None,
                         }
                     )
@@ -243,8 +328,31 @@ class PolicyCatalogManager(PolicyCatalogInterface):
             logger.error(f"Failed to get detailed policies: {str(e)}")
             raise CatalogError("Failed to get detailed policies", str(e))
 
+    def _get_policy_lookup(
+        self, policy_index: PolicyIndex
+    ) -> Dict[str, PolicyCatalogEntry]:
+        """Return a name -> entry map for the index, built once per loaded index."""
+        if policy_index is self._cached_index and self._policy_lookup is not None:
+            return self._policy_lookup
+
+        lookup = {
+            policy.name: policy
+            for policies in policy_index.categories.values()
+            for policy in policies
+        }
+        if policy_index is self._cached_index:
+            self._policy_lookup = lookup
+        return lookup
+
+    def _invalidate_index_cache(self) -> None:
+        """Drop the cached index so the next load re-reads the index file."""
+        self._cached_index = None
+        self._cached_index_mtime = None
+        self._policy_lookup = None
+
     def _cleanup_existing_catalog(self) -> None:
         """Remove existing policy catalog directory."""
+        self._invalidate_index_cache()
         if os.path.exists(self.local_storage):
             logger.info(f"Removing existing policy catalog: {self.local_storage}")
             FileUtils.remove_directory(self.local_storage)
@@ -252,26 +360,100 @@ class PolicyCatalogManager(PolicyCatalogInterface):
         # Recreate directory
         FileUtils.ensure_directory(self.local_storage)
 
-    def _clone_repository(self, url: str, branch: str) -> Optional[str]:
-        """Clone a Git repository to temporary directory (GitHub, GitLab, etc.)."""
+    def _clone_repository(
+        self, url: str, branch: str, sparse_paths: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Clone a Git repository to temporary directory (GitHub, GitLab, etc.).
+
+        When sparse_paths is given, a blobless partial clone is checked out
+        with a cone-mode sparse checkout of just those directories, so blobs
+        outside them are never downloaded.
+
+        When catalog.repo_cache is set, clones live there across runs and an
+        existing clone is refreshed with a shallow fetch instead.
+        """
         try:
             # Generate repository directory name
-            repo_name = self._get_repo_name_from_url(url)
-            temp_dir = os.path.join(tempfile.gettempdir(), f"aegis_repo_{repo_name}")
+            repo_root = (
+                os.path.expanduser(self.repo_cache)
+                if self.repo_cache
+                else tempfile.gettempdir()
+            )
+            temp_dir = os.path.join(
+                repo_root, self._get_repo_directory_name(url, branch)
+            )
+
+            # Refresh a cached clone in place when possible
+            cached = self.repo_cache and os.path.isdir(os.path.join(temp_dir, ".git"))
+            if cached and self._update_cached_repository(
+                temp_dir, url, branch, sparse_paths
+            ):
+                return temp_dir
 
             # Remove if exists
             if os.path.exists(temp_dir):
                 FileUtils.remove_directory(temp_dir)
 
             # Clone repository
-            cmd = ["git", "clone", "--depth", "1", "--branch", branch, url, temp_dir]
+            if sparse_paths:
+                commands = [
+                    [
+                        *_GIT_NETWORK_COMMAND,
+                        "clone",
+                        "--depth",
+                        "1",
+                        "--filter=blob:none",
+                        "--no-checkout",
+                        "--branch",
+                        branch,
+                        url,
+                        temp_dir,
+                    ],
+                    [
+                        *_GIT_NETWORK_COMMAND,
+                        "-C",
+                        temp_dir,
+                        "sparse-checkout",
+                        "init",
+                        "--cone",
+                    ],
+                    [
+                        *_GIT_NETWORK_COMMAND,
+                        "-C",
+                        temp_dir,
+                        "sparse-checkout",
+                        "set",
+                        *sparse_paths,
+                    ],
+                    [*_GIT_NETWORK_COMMAND, "-C", temp_dir, "checkout", branch],
+                ]
+            else:
+                commands = [
+                    [
+                        *_GIT_NETWORK_COMMAND,
+                        "clone",
+                        "--depth",
+                        "1",
+                        "--branch",
+                        branch,
+                        url,
+                        temp_dir,
+                    ]
+                ]
 
             logger.info(f"Cloning repository {url} (branch: {branch})")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            for cmd in commands:
+                result = subprocess.run(
+                    cmd, capture_output=True, text=True, timeout=300
+                )
 
-            if result.returncode != 0:
-                logger.error(f"Failed to clone repository {url}: {result.stderr}")
-                return None
+                if result.returncode != 0:
+                    logger.error(f"Failed to clone repository {url}: {result.stderr}")
+                    return None
+
+            if self.repo_cache:
+                self._write_cache_state(temp_dir, url, branch, sparse_paths)
 
             logger.info(f"Successfully cloned {url} to {temp_dir}")
             return temp_dir
@@ -283,17 +465,160 @@ class PolicyCatalogManager(PolicyCatalogInterface):
             logger.error(f"Error cloning repository {url}: {str(e)}")
             return None
 
+    def _update_cached_repository(
+        self,
+        repo_dir: str,
+        url: str,
+        branch: str,
+        sparse_paths: Optional[List[str]] = None,
+    ) -> bool:
+        """Bring a cached clone up to date; return False if it must be re-cloned."""
+        try:
+            # Never fetch into a clone of some other remote
+            result = subprocess.run(
+                ["git", "-C", repo_dir, "config", "--get", "remote.origin.url"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            if result.returncode != 0 or result.stdout.strip() != url:
+                logger.warning(
+                    f"Cached repository {repo_dir} does not track {url}, re-cloning"
+                )
+                return False
+
+            # Skip the fetch entirely if the clone was refreshed recently with
+            # the same branch and sparse paths
+            fetch_head = os.path.join(repo_dir, ".git", "FETCH_HEAD")
+            if (
+                self._read_cache_state(repo_dir)
+                == self._cache_state(url, branch, sparse_paths)
+                and os.path.exists(fetch_head)
+                and time.time() - os.path.getmtime(fetch_head) < self.repo_cache_ttl
+            ):
+                logger.info(f"Using recently fetched cached repository {url}")
+                return True
+
+            commands = [
+                [
+                    *_GIT_NETWORK_COMMAND,
+                    "-C",
+                    repo_dir,
+                    "fetch",
+                    "--depth",
+                    "1",
+                    "origin",
+                    branch,
+                ],
+                [
+                    *_GIT_NETWORK_COMMAND,
+                    "-C",
+                    repo_dir,
+                    "reset",
+                    "--hard",
+                    "FETCH_HEAD",
+                ],
+            ]
+            # Re-apply the sparse paths, or leave sparse mode when none are set
+            if sparse_paths:
+                commands.extend(
+                    [
+                        [
+                            *_GIT_NETWORK_COMMAND,
+                            "-C",
+                            repo_dir,
+                            "sparse-checkout",
+                            "init",
+                            "--cone",
+                        ],
+                        [
+                            *_GIT_NETWORK_COMMAND,
+                            "-C",
+                            repo_dir,
+                            "sparse-checkout",
+                            "set",
+                            *sparse_paths,
+                        ],
+                    ]
+                )
+            else:
+                commands.append(
+                    [
+                        *_GIT_NETWORK_COMMAND,
+                        "-C",
+                        repo_dir,
+                        "sparse-checkout",
+                        "disable",
+                    ]
+                )
+
+            logger.info(f"Updating cached repository {url} (branch: {branch})")
+            for cmd in commands:
+                result = subprocess.run(
+                    cmd, capture_output=True, text=True, timeout=300
+                )
+                if result.returncode != 0:
+                    logger.warning(
+                        f"Failed to update cached repository {url}, re-cloning: {result.stderr}"
+                    )
+                    return False
+
+            self._write_cache_state(repo_dir, url, branch, sparse_paths)
+            return True
+
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Timeout updating cached repository {url}, re-cloning")
+            return False
+        except Exception as e:
+            logger.warning(
+                f"Error updating cached repository {url}, re-cloning: {str(e)}"
+            )
+            return False
+
+    @staticmethod
+    def _cache_state(
+        url: str, branch: str, sparse_paths: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Describe what a cached clone is checked out with."""
+        return {"url": url, "branch": branch, "sparse_paths": sparse_paths or []}
+
+    def _read_cache_state(self, repo_dir: str) -> Optional[Dict[str, Any]]:
+        """Load the state recorded for a cached clone, or None if unknown."""
+        try:
+            return FileUtils.read_json(os.path.join(repo_dir, _CACHE_STATE_FILE))
+        except Exception:
+            return None
+
+    def _write_cache_state(
+        self,
+        repo_dir: str,
+        url: str,
+        branch: str,
+        sparse_paths: Optional[List[str]],
+    ) -> None:
+        """Record the state of a cached clone; without it the next run refetches."""
+        try:
+            FileUtils.write_json(
+                os.path.join(repo_dir, _CACHE_STATE_FILE),
+                self._cache_state(url, branch, sparse_paths),
+            )
+        except Exception as e:
+            logger.warning(f"Could not record cache state for {repo_dir}: {str(e)}")
+
+    def _get_repo_directory_name(self, url: str, branch: str) -> str:
+        """Name the clone directory for a repository branch.
+
+        Repositories with the same owner/repo on different hosts or branches
+        are cloned concurrently, so the name carries a digest of url and branch.
+        """
+        digest = hashlib.sha256(f"{url}\n{branch}".encode("utf-8")).hexdigest()[:8]
+        return f"aegis_repo_{self._get_repo_name_from_url(url)}-{digest}"
+
     def _get_repo_name_from_url(self, url: str) -> str:
         """Extract repository name from Git URL (GitHub, GitLab, etc.)."""
-        # Handle both https and git URLs
-        if url.endswith(".git"):
-            url = url[:-4]
-
-        parts = url.rstrip("/").split("/")
-        if len(parts) >= 2:
-            owner = parts[-2]
-            repo = parts[-1]
-            return f"{owner}-{repo}"
+        owner_repo = _split_owner_repo(url)
+        if owner_repo:
+            return "{}-{}".format(*owner_repo)
 
         return "unknown-repo"
 
@@ -302,15 +627,21 @@ class PolicyCatalogManager(PolicyCatalogInterface):
     ) -> None:
         """Process cloned repositories to extract policies and tests."""
         # Store repo info for later use during indexing
-        self._repo_info = repo_info
+        self._set_repo_info(repo_info)
+        if not source_dirs:
+            return
 
-        for source_dir in source_dirs:
+        # Scanning each clone is independent, so walk them concurrently
+        max_workers = min(len(source_dirs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            found_files = list(executor.map(self._find_policy_files, source_dirs))
+
+        # Copy in configured order so later repositories still win on conflicts
+        for source_dir, policy_files in zip(source_dirs, found_files):
             repo_name = repo_info.get(source_dir, "unknown")
             logger.info(f"Processing repository: {source_dir} ({repo_name})")
 
             try:
-                # Find policy files using grep (adapted from bash script)
-                policy_files = self._find_policy_files(source_dir)
 
                 # Copy policy files preserving directory structure
                 self._copy_policy_files(source_dir, policy_files)
@@ -327,50 +658,50 @@ class PolicyCatalogManager(PolicyCatalogInterface):
     def _find_policy_files(self, source_dir: str) -> List[str]:
         """Find Kyverno policy files in the repository."""
         try:
-            # Use grep to find files with ClusterPolicy kind and validationFailureAction
-            cmd1 = [
-                "grep",
-                "-r",
-                "--exclude-dir=.*",
-                "--include=*.yaml",
-                "-l",
-                "-e",
-                "kind: ClusterPolicy$",
-                source_dir,
-            ]
-
-            result1 = subprocess.run(cmd1, capture_output=True, text=True)
-            if result1.returncode != 0:
-                return []
-
-            candidate_files = result1.stdout.strip().split("\n")
-            if not candidate_files or candidate_files == [""]:
-                return []
-
-            # Filter files that also contain validationFailureAction
-            cmd2 = ["grep", "-l", "-e", "validationFailureAction"] + candidate_files
-            result2 = subprocess.run(cmd2, capture_output=True, text=True)
-
-            if result2.returncode != 0:
-                return []
-
-            policy_files = result2.stdout.strip().split("\n")
-            return [f for f in policy_files if f]
+            # Hidden directories such as .git and .kyverno-test are skipped
+            return FileUtils.find_files(source_dir, self._is_policy_file)
 
         except Exception as e:
             logger.error(f"Error finding policy files in {source_dir}: {str(e)}")
             return []
 
+    @staticmethod
+    def _is_policy_file(file_path: str) -> bool:
+        """Check for a ClusterPolicy document with validationFailureAction."""
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _MIN_POLICY_FILE_SIZE:
+                return False
+
+            # Small files are cheaper to read than to map
+            if size < _MMAP_THRESHOLD:
+                content = f.read()
+                return b"validationFailureAction" in content and bool(
+                    _CLUSTER_POLICY_KIND.search(content)
+                )
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return content.find(b"validationFailureAction") != -1 and bool(
+                    _CLUSTER_POLICY_KIND.search(content)
+                )
+
     def _copy_policy_files(self, source_dir: str, policy_files: List[str]) -> None:
         """Copy policy files to catalog preserving directory structure."""
+        created_dirs = set()
         for policy_file in policy_files:
             try:
                 # Calculate relative path from source directory
                 rel_path = os.path.relpath(policy_file, source_dir)
                 dest_path = os.path.join(self.local_storage, rel_path)
 
-                # Copy file
-                FileUtils.copy_file(policy_file, dest_path, create_dirs=True)
+                # Policies share directories, so create each one only once
+                dest_dir = os.path.dirname(dest_path)
+                if dest_dir not in created_dirs:
+                    os.makedirs(dest_dir, exist_ok=True)
+                    created_dirs.add(dest_dir)
+
+                # Content only; the catalog does not need source timestamps
+                shutil.copyfile(policy_file, dest_path)
                 logger.debug(f"Copied policy file: {rel_path}")
 
             except Exception as e:
@@ -431,7 +762,7 @@ class PolicyCatalogManager(PolicyCatalogInterface):
 
             # Parse test file to find resource and variable files
             try:
-                test_data = YamlUtils.load_yaml_safe(kyverno_test_file)
+                test_data = YamlUtils.load_yaml_safe_from_string(test_content)
                 resources = test_data.get("resources", [])
                 variables = test_data.get("variables", [])
 
@@ -529,11 +860,67 @@ class PolicyCatalogManager(PolicyCatalogInterface):
             except Exception as e:
                 logger.warning(f"Failed to cleanup repository {source_dir}: {str(e)}")
 
+    def _create_policy_entries(
+        self, policy_files: List[str]
+    ) -> List[Optional[PolicyCatalogEntry]]:
+        """
+        Parse policy files into catalog entries, in input order.
+
+        Large catalogs are parsed on a process pool since YAML parsing is
+        CPU-bound; small ones, single-CPU hosts, and environments where worker
+        processes cannot start parse in this process.
+        """
+        max_workers = os.cpu_count() or 1
+        if max_workers > 1 and len(policy_files) >= _PARALLEL_INDEX_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_index_worker,
+                    initargs=(self.config, getattr(self, "_repo_info", None)),
+                ) as executor:
+                    return list(
+                        executor.map(
+                            _create_policy_entry_in_worker,
+                            policy_files,
+                            chunksize=_INDEX_CHUNK_SIZE,
+                        )
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"Parallel indexing unavailable, indexing serially: {str(e)}"
+                )
+
+        return [self._create_policy_entry(policy_file) for policy_file in policy_files]
+
+    def _iter_policy_files(self, root: str) -> Iterator[str]:
+        """Yield candidate policy files under root, skipping tests and resources."""
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Chainsaw test directories never hold catalog policies
+            dirnames[:] = [d for d in dirnames if ".chainsaw-test" not in d]
+            if ".chainsaw-test" in dirpath:
+                continue
+
+            for filename in filenames:
+                if (
+                    not filename.endswith(".yaml")
+                    or filename in _SKIPPED_FILENAMES
+                    or filename.startswith("test-")
+                    or filename.endswith(_SKIPPED_SUFFIXES)
+                ):
+                    continue
+                yield os.path.join(dirpath, filename)
+
     def _create_policy_entry(self, policy_file: str) -> Optional[PolicyCatalogEntry]:
         """Create a PolicyCatalogEntry from a policy file."""
         try:
+            raw_content = FileUtils.read_file(policy_file)
+
+            # Every valid policy mentions these; skip the YAML parse otherwise
+            if not all(marker in raw_content for marker in _POLICY_MARKERS):
+                return None
+
             # Load policy content using safe loader for multi-document files
-            policy_content = YamlUtils.load_yaml_safe(policy_file)
+            policy_content = YamlUtils.load_yaml_safe_from_string(raw_content)
 
             # Check if this is a valid Kyverno policy
             if not self._is_valid_kyverno_policy(policy_content):
@@ -593,26 +980,10 @@ class PolicyCatalogManager(PolicyCatalogInterface):
 
     def _determine_category_from_path(self, rel_path: str) -> str:
         """Determine policy category from file path."""
-        path_parts = rel_path.lower().split(os.sep)
-
-        # Common category mappings
-        category_keywords = {
-            "best-practices": ["best-practices", "best_practices", "bestpractices"],
-            "security": ["security", "sec"],
-            "compliance": ["compliance", "cis", "nist", "pci", "hipaa"],
-            "networking": ["networking", "network", "ingress", "service"],
-            "storage": ["storage", "pv", "pvc", "volume"],
-            "rbac": ["rbac", "role", "rolebinding", "serviceaccount"],
-            "pod-security": ["pod-security", "podsecurity", "pss"],
-            "resource-management": ["resources", "limits", "requests", "quota"],
-            "workload": ["workload", "deployment", "pod", "job"],
-            "other": [],
-        }
-
-        for part in path_parts:
-            for category, keywords in category_keywords.items():
-                if any(keyword in part for keyword in keywords):
-                    return category
+        for part in rel_path.lower().split(os.sep):
+            category = _category_for_path_part(part)
+            if category:
+                return category
 
         return "other"
 
@@ -621,16 +992,10 @@ class PolicyCatalogManager(PolicyCatalogInterface):
         policy_dir = os.path.dirname(policy_file)
 
         # Check if there are any test files in the policy directory
-        test_files = [
-            "kyverno-test.yaml",
-            "resource.yaml",
-            "resources.yaml",
-            "values.yaml",
-        ]
-        has_test_files = any(
-            os.path.exists(os.path.join(policy_dir, test_file))
-            for test_file in test_files
-        )
+        try:
+            has_test_files = not _TEST_FILENAMES.isdisjoint(os.listdir(policy_dir))
+        except OSError:
+            has_test_files = False
 
         if has_test_files:
             return os.path.relpath(policy_dir, self.local_storage)
@@ -658,36 +1023,51 @@ class PolicyCatalogManager(PolicyCatalogInterface):
                     tags.extend([tag.strip() for tag in value.split(",")])
 
         # Extract from path
-        path_parts = rel_path.split(os.sep)
         tags.extend(
-            [part.replace("-", " ").replace("_", " ") for part in path_parts[:-1]]
+            part.replace("-", " ").replace("_", " ")
+            for part in rel_path.split(os.sep)[:-1]
         )
 
-        # Clean and deduplicate tags
+        # Clean and deduplicate tags case-insensitively, keeping first spelling
         cleaned_tags = []
+        seen = set()
         for tag in tags:
-            if tag and tag.lower() not in [t.lower() for t in cleaned_tags]:
-                cleaned_tags.append(tag.strip())
-
-        return cleaned_tags[:10]  # Limit to 10 tags
+            tag = tag.strip()
+            key = tag.lower()
+            if tag and key not in seen:
+                seen.add(key)
+                cleaned_tags.append(tag)
+                if len(cleaned_tags) == 10:  # Limit to 10 tags
+                    break
+
+        return cleaned_tags
+
+    def _set_repo_info(self, repo_info: Dict[str, str]) -> None:
+        """Store clone directory -> URL info and precompute per-repo name matching."""
+        self._repo_info = repo_info
+        self._repo_urls = list(repo_info.values())
+        self._repo_names = [
+            (self._extract_repo_name_from_url(repo_url).lower(), repo_url)
+            for repo_url in self._repo_urls
+        ]
 
     def _determine_source_repo(self, rel_path: str) -> str:
         """Determine source repository URL from path."""
         # Use stored repo info if available
         if hasattr(self, "_repo_info"):
             # For single repository catalogs, return the full HTTPS URL
-            if len(self._repo_info) == 1:
-                return list(self._repo_info.values())[0]
+            if len(self._repo_urls) == 1:
+                return self._repo_urls[0]
 
             # For multiple repositories, try to match based on path patterns
             # This is a simple heuristic - in practice, we might need more sophisticated mapping
-            for source_dir, repo_url in self._repo_info.items():
-                repo_name = self._extract_repo_name_from_url(repo_url)
-                if repo_name.lower() in rel_path.lower():
+            rel_path_lower = rel_path.lower()
+            for repo_name, repo_url in self._repo_names:
+                if repo_name in rel_path_lower:
                     return repo_url
 
             # If no match found, return the first repository URL (full HTTPS URL)
-            return list(self._repo_info.values())[0]
+            return self._repo_urls[0]
 
         # Fallback - return unknown since we don't have the original URL
         return "unknown"
@@ -695,16 +1075,10 @@ class PolicyCatalogManager(PolicyCatalogInterface):
     def _extract_repo_name_from_url(self, url: str) -> str:
         """Extract owner/repo from Git URL (GitHub, GitLab, etc.)."""
         try:
-            # Handle both https and git URLs
-            if url.endswith(".git"):
-                url = url[:-4]
-
             # Extract from URL like https://github.com/kyverno/policies or https://gitlab.com/owner/repo
-            parts = url.rstrip("/").split("/")
-            if len(parts) >= 2:
-                owner = parts[-2]
-                repo = parts[-1]
-                return f"{owner}/{repo}"
+            owner_repo = _split_owner_repo(url)
+            if owner_repo:
+                return "{}/{}".format(*owner_repo)
 
             return "unknown"
         except Exception:
@@ -721,21 +1095,10 @@ class PolicyCatalogManager(PolicyCatalogInterface):
             }
 
             for category, policies in policy_index.categories.items():
-                index_data["categories"][category] = [
-                    {
-                        "name": p.name,
-                        "category": p.category,
-                        "description": p.description,
-                        "relative_path": p.relative_path,
-                        "test_directory": p.test_directory,
-                        "source_repo": p.source_repo,
-                        "tags": p.tags,
-                    }
-                    for p in policies
-                ]
+                index_data["categories"][category] = [p.to_dict() for p in policies]
 
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False)
+            FileUtils.write_json(self.index_file, index_data)
+            self._invalidate_index_cache()
 
             logger.info(f"Policy index saved to {self.index_file}")
 
@@ -749,8 +1112,15 @@ class PolicyCatalogManager(PolicyCatalogInterface):
             if not os.path.exists(self.index_file):
                 return None
 
-            with open(self.index_file, "r", encoding="utf-8") as f:
-                index_data = json.load(f)
+            # Reuse the parsed index while the file is unchanged
+            index_mtime = os.path.getmtime(self.index_file)
+            if (
+                self._cached_index is not None
+                and self._cached_index_mtime == index_mtime
+            ):
+                return self._cached_index
+
+            index_data = FileUtils.read_json(self.index_file)
 
             policy_index = PolicyIndex()
             policy_index.total_policies = index_data.get("total_policies", 0)
@@ -774,8 +1144,30 @@ class PolicyCatalogManager(PolicyCatalogInterface):
                     policies.append(policy)
                 policy_index.categories[category] = policies
 
+            self._cached_index = policy_index
+            self._cached_index_mtime = index_mtime
+            self._policy_lookup = None
             return policy_index
 
         except Exception as e:
             logger.error(f"Failed to load policy index: {str(e)}")
             return None
+
+
+# Per-process catalog manager used by index workers
+_worker_manager: Optional[PolicyCatalogManager] = None
+
+
+def _init_index_worker(
+    config: Dict[str, Any], repo_info: Optional[Dict[str, str]]
+) -> None:
+    """Create the catalog manager each index worker process parses with."""
+    global _worker_manager
+    _worker_manager = PolicyCatalogManager(config)
+    if repo_info is not None:
+        _worker_manager._set_repo_info(repo_info)
+
+
+def _create_policy_entry_in_worker(policy_file: str) -> Optional[PolicyCatalogEntry]:
+    """Parse one policy file in an index worker process."""
+    return _worker_manager._create_policy_entry(policy_file)
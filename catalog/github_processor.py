@@ -7,6 +7,7 @@ import os
 import subprocess
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 from urllib.parse import urlparse
@@ -70,46 +71,19 @@ class GitHubProcessor:
             return None
 
     def find_policy_files(self, repo_dir: str) -> List[str]:
-        """Find Kyverno policy files in repository using grep."""
+        """Find Kyverno policy files in repository with a single read per file."""
         try:
             logger.info(f"Finding policy files in {repo_dir}")
 
-            # First, find files with ClusterPolicy kind
-            cmd1 = [
-                "grep",
-                "-r",
-                "--exclude-dir=.*",
-                "--include=*.yaml",
-                "-l",
-                "-e",
-                "kind: ClusterPolicy",
-                repo_dir,
-            ]
-
-            result1 = subprocess.run(cmd1, capture_output=True, text=True)
-            if result1.returncode != 0:
-                logger.warning(f"No ClusterPolicy files found in {repo_dir}")
-                return []
-
-            candidate_files = [
-                f.strip() for f in result1.stdout.strip().split("\n") if f.strip()
-            ]
-            if not candidate_files:
-                return []
-
-            # Filter files that also contain validationFailureAction
-            cmd2 = ["grep", "-l", "-e", "validationFailureAction"] + candidate_files
-            result2 = subprocess.run(cmd2, capture_output=True, text=True)
+            # Hidden directories are skipped, as grep --exclude-dir=.* did
+            policy_files = FileUtils.find_files(repo_dir, self._is_policy_file)
 
-            if result2.returncode != 0:
+            if not policy_files:
                 logger.warning(
                     f"No policy files with validationFailureAction found in {repo_dir}"
                 )
                 return []
 
-            policy_files = [
-                f.strip() for f in result2.stdout.strip().split("\n") if f.strip()
-            ]
             logger.info(f"Found {len(policy_files)} policy files in {repo_dir}")
 
             return policy_files
@@ -118,6 +92,15 @@ class GitHubProcessor:
             logger.error(f"Error finding policy files in {repo_dir}: {str(e)}")
             return []
 
+    @staticmethod
+    def _is_policy_file(file_path: str) -> bool:
+        """Check for a ClusterPolicy file with validationFailureAction."""
+        with open(file_path, "rb") as f:
+            content = f.read()
+        return (
+            b"kind: ClusterPolicy" in content and b"validationFailureAction" in content
+        )
+
     def extract_policies_with_tests(
         self, repo_dir: str, policy_files: List[str]
     ) -> Dict[str, Dict[str, Any]]:
@@ -127,30 +110,21 @@ class GitHubProcessor:
 
             extracted_policies = {}
 
-            for policy_file in policy_files:
-                try:
-                    # Get relative path from repo root
-                    rel_path = os.path.relpath(policy_file, repo_dir)
-                    policy_dir = os.path.dirname(policy_file)
-
-                    # Find associated test files
-                    test_files = self._find_test_files(policy_dir)
-
-                    # Store policy information
-                    extracted_policies[rel_path] = {
-                        "policy_file": policy_file,
-                        "relative_path": rel_path,
-                        "test_files": test_files,
-                        "policy_dir": policy_dir,
-                    }
-
-                    logger.debug(
-                        f"Extracted policy: {rel_path} with {len(test_files)} test files"
-                    )
-
-                except Exception as e:
-                    logger.warning(f"Failed to extract policy {policy_file}: {str(e)}")
-                    continue
+            # Each policy's test lookup reads and parses YAML, so overlap the I/O
+            targets = [
+                (
+                    os.path.relpath(policy_file, repo_dir),
+                    policy_file,
+                    os.path.dirname(policy_file),
+                )
+                for policy_file in policy_files
+            ]
+            if targets:
+                max_workers = min(32, (os.cpu_count() or 1) * 4, len(targets))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for result in executor.map(self._extract_one, targets):
+                        if result is not None:
+                            extracted_policies[result["relative_path"]] = result
 
             logger.info(f"Extracted {len(extracted_policies)} policies from {repo_dir}")
             return extracted_policies
@@ -159,6 +133,28 @@ class GitHubProcessor:
             logger.error(f"Error extracting policies from {repo_dir}: {str(e)}")
             return {}
 
+    def _extract_one(self, target: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        """Extract a single policy and its test files, or None on failure."""
+        rel_path, policy_file, policy_dir = target
+        try:
+            # Find associated test files
+            test_files = self._find_test_files(policy_dir)
+
+            logger.debug(
+                f"Extracted policy: {rel_path} with {len(test_files)} test files"
+            )
+
+            return {
+                "policy_file": policy_file,
+                "relative_path": rel_path,
+                "test_files": test_files,
+                "policy_dir": policy_dir,
+            }
+
+        except Exception as e:
+            logger.warning(f"Failed to extract policy {policy_file}: {str(e)}")
+            return None
+
     def copy_policies_to_catalog(
         self,
         repo_dir: str,
@@ -4,7 +4,6 @@ Creates lightweight metadata index for efficient policy selection and AI consump
 """
 
 import os
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -80,8 +79,7 @@ class PolicyIndexer:
                 logger.warning(f"Index file not found: {self.index_file}")
                 return None
 
-            with open(self.index_file, "r", encoding="utf-8") as f:
-                index_data = json.load(f)
+            index_data = FileUtils.read_json(self.index_file)
 
             return self._deserialize_index(index_data)
 
@@ -172,13 +170,7 @@ class PolicyIndexer:
                     policy = policy_lookup[policy_name]
                     detailed_policies.append(
                         {
-                            "name": policy.name,
-                            "category": policy.category,
-                            "description": policy.description,
-                            "relative_path": policy.relative_path,
-                            "test_directory": policy.test_directory,
-                            "source_repo": policy.source_repo,
-                            "tags": policy.tags,
+                            **policy.to_dict(),
                             "has_tests": policy.test_directory is not None,
                         }
                     )
@@ -516,8 +508,7 @@ class PolicyIndexer:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
 
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False)
+            FileUtils.write_json(self.index_file, index_data)
 
             logger.info(f"Policy index saved to {self.index_file}")
 
@@ -534,18 +525,7 @@ class PolicyIndexer:
                 "categories_count": len(policy_index.categories),
             },
             "categories": {
-                category: [
-                    {
-                        "name": policy.name,
-                        "category": policy.category,
-                        "description": policy.description,
-                        "relative_path": policy.relative_path,
-                        "test_directory": policy.test_directory,
-                        "source_repo": policy.source_repo,
-                        "tags": policy.tags,
-                    }
-                    for policy in policies
-                ]
+                category: [policy.to_dict() for policy in policies]
                 for category, policies in policy_index.categories.items()
             },
         }
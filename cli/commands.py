@@ -7,6 +7,7 @@ import os
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from utils.logging_utils import LoggerMixin
+from utils.file_utils import FileUtils
 
 
 class BaseCommand(ABC, LoggerMixin):
@@ -252,7 +253,6 @@ class RecommendCommand(BaseCommand):
 
         try:
             import yaml
-            import json
             import time
             from datetime import datetime
             from ..ai import BedrockClient, AIPolicySelector
@@ -311,8 +311,7 @@ class RecommendCommand(BaseCommand):
             )
 
             # Load policy index
-            with open(index_path, "r", encoding="utf-8") as f:
-                index_data = json.load(f)
+            index_data = FileUtils.read_json(index_path)
 
             # Convert to PolicyIndex object (simplified)
             categories = {}
@@ -548,7 +548,6 @@ def recommend(
 
     try:
         import yaml
-        import json
         import time
         from datetime import datetime
 
@@ -560,6 +559,7 @@ def recommend(
                 PolicyIndex,
                 PolicyCatalogEntry,
             )
+            from utils.file_utils import FileUtils
         except ImportError:
             from aegis.ai import BedrockClient, AIPolicySelector
             from aegis.models import (
@@ -568,12 +568,12 @@ def recommend(
                 PolicyIndex,
                 PolicyCatalogEntry,
             )
+            from aegis.utils.file_utils import FileUtils
 
         def load_policy_index_from_file(index_path: str) -> PolicyIndex:
             """Load policy index from JSON file."""
             try:
-                with open(index_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = FileUtils.read_json(index_path)
 
                 # Convert to PolicyIndex object
                 categories = {}
@@ -1025,19 +1025,20 @@ def recommend(
         except ImportError:
             from aegis.utils.progress_utils import show_troubleshooting_tips
 
-        if "cluster-discovery.yaml" in str(e).lower():
+        error_text = str(e).lower()
+        if "cluster-discovery.yaml" in error_text:
             tips = [
                 "Run 'aegis discover' to generate cluster information",
                 "Run 'aegis questionnaire' to add governance requirements",
                 "Verify the cluster-discovery.yaml file is valid YAML format",
             ]
-        elif "policy index" in str(e).lower() or "catalog" in str(e).lower():
+        elif "policy index" in error_text or "catalog" in error_text:
             tips = [
                 "Run 'aegis catalog' to build the policy catalog",
                 "Check internet connectivity for GitHub repository access",
                 "Verify the policy index file exists and is readable",
             ]
-        elif "ai" in str(e).lower() or "bedrock" in str(e).lower():
+        elif "ai" in error_text or "bedrock" in error_text:
             tips = [
                 "Check AWS credentials and Bedrock service availability",
                 "Verify the AI model is available in your region",
@@ -5,7 +5,8 @@ Handles automated cluster analysis and information gathering.
 
 import os
 import yaml
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional
 from datetime import datetime
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
@@ -119,15 +120,27 @@ class ClusterDiscovery(LoggerMixin):
             self.logger.error(error_msg)
             raise ClusterDiscoveryError(error_msg)
 
+    @staticmethod
+    def _call_concurrently(*calls: Callable[[], Any]) -> List[Any]:
+        """
+        Run independent API calls in parallel so their round trips overlap.
+
+        Results are returned in the order the calls were given; the first
+        exception raised by a call is re-raised to the caller.
+        """
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
     def _discover_basic_info(self) -> Dict[str, Any]:
         """Discover basic cluster information."""
         try:
             version_api = client.VersionApi(self.k8s_client)
-            version_info = version_api.get_code()
-
             core_v1 = client.CoreV1Api(self.k8s_client)
-            nodes = core_v1.list_node()
-            namespaces = core_v1.list_namespace()
+
+            version_info, nodes, namespaces = self._call_concurrently(
+                version_api.get_code, core_v1.list_node, core_v1.list_namespace
+            )
 
             return {
                 "kubernetes_version": f"{version_info.major}.{version_info.minor}",
@@ -188,11 +201,13 @@ class ClusterDiscovery(LoggerMixin):
             apps_v1 = client.AppsV1Api(self.k8s_client)
 
             # Count various resource types
-            pods = core_v1.list_pod_for_all_namespaces()
-            services = core_v1.list_service_for_all_namespaces()
-            deployments = apps_v1.list_deployment_for_all_namespaces()
-            configmaps = core_v1.list_config_map_for_all_namespaces()
-            secrets = core_v1.list_secret_for_all_namespaces()
+            pods, services, deployments, configmaps, secrets = self._call_concurrently(
+                core_v1.list_pod_for_all_namespaces,
+                core_v1.list_service_for_all_namespaces,
+                apps_v1.list_deployment_for_all_namespaces,
+                core_v1.list_config_map_for_all_namespaces,
+                core_v1.list_secret_for_all_namespaces,
+            )
 
             # Analyze namespace distribution
             namespace_stats = {}
@@ -6,6 +6,7 @@ AI Enabled Governance Insights & Suggestions for Kubernetes
 
 import sys
 import os
+import multiprocessing
 
 # Add the current directory to Python path so we can import modules
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -28,4 +29,6 @@ except ImportError:
         from main import cli
 
 if __name__ == "__main__":
+    # Needed for catalog indexing worker processes in frozen binaries
+    multiprocessing.freeze_support()
     cli()
@@ -3,6 +3,7 @@ Core data models for AEGIS CLI tool.
 Defines data structures for cluster information, policies, and requirements.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -30,6 +31,10 @@ class ThirdPartyController:
     version: Optional[str] = None
     configuration: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, str]:
+        """Return the name/type summary used in reports and AI prompts."""
+        return {"name": self.name, "type": self.type.value}
+
 
 @dataclass
 class ClusterInfo:
@@ -46,7 +51,11 @@ class ClusterInfo:
     discovery_timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class PolicyCatalogEntry:
     """Represents a policy in the catalog."""
 
@@ -58,6 +67,18 @@ class PolicyCatalogEntry:
     source_repo: str = ""
     tags: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the entry as stored in the policy index file."""
+        return {
+            "name": self.name,
+            "category": self.category,
+            "description": self.description,
+            "relative_path": self.relative_path,
+            "test_directory": self.test_directory,
+            "source_repo": self.source_repo,
+            "tags": self.tags,
+        }
+
 
 @dataclass
 class PolicyIndex:
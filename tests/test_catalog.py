@@ -3,6 +3,7 @@ Tests for AEGIS catalog functionality.
 """
 
 import os
+import subprocess
 import tempfile
 import shutil
 import pytest
@@ -16,6 +17,25 @@ from catalog import PolicyCatalogManager, PolicyIndexer, GitHubProcessor
 from models import PolicyIndex, PolicyCatalogEntry
 from exceptions import CatalogError
 
+POLICY_YAML = "kind: ClusterPolicy\nspec:\n  validationFailureAction: Audit\n"
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not found")
+
+
+def _init_git_repo(repo_dir, files, branch="main"):
+    """Create a git repository at repo_dir committing the given files."""
+    for rel_path, content in files.items():
+        path = os.path.join(repo_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+    git = ["git", "-C", repo_dir, "-c", "user.name=test", "-c", "user.email=t@t"]
+    subprocess.run(["git", "init", "-q", "-b", branch, repo_dir], check=True)
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "policies"], check=True)
+    return "file://" + repo_dir
+
 
 class TestPolicyCatalogManager:
     """Test PolicyCatalogManager functionality."""
@@ -90,17 +110,11 @@ class TestPolicyCatalogManager:
         assert policy_index.total_policies == 0
         assert len(policy_index.categories) == 0
 
-    @patch("catalog.catalog_manager.FileUtils.list_files")
-    def test_build_policy_index_with_policies(self, mock_list_files):
+    def test_build_policy_index_with_policies(self):
         """Test building index with policies."""
         # Create catalog directory
         os.makedirs(self.catalog_dir, exist_ok=True)
 
-        # Mock policy files
-        mock_list_files.return_value = [
-            os.path.join(self.catalog_dir, "test-policy.yaml")
-        ]
-
         # Create a test policy file
         test_policy_content = """
 apiVersion: kyverno.io/v1
@@ -141,6 +155,158 @@ spec:
         with pytest.raises(CatalogError):
             self.catalog_manager.get_policies_detailed(["test-policy"])
 
+    def test_load_policy_index_is_cached(self):
+        """Test that the parsed index and name lookup are reused."""
+        policy_index = PolicyIndex()
+        policy_index.categories["security"] = [
+            PolicyCatalogEntry(
+                name="test-policy",
+                category="security",
+                description="Test policy",
+                relative_path="security/test-policy.yaml",
+            )
+        ]
+        policy_index.total_policies = 1
+        self.catalog_manager._save_policy_index(policy_index)
+
+        loaded = self.catalog_manager._load_policy_index()
+        assert self.catalog_manager._load_policy_index() is loaded
+
+        detailed = self.catalog_manager.get_policies_detailed(["test-policy"])
+        assert detailed[0]["relative_path"] == "security/test-policy.yaml"
+        assert self.catalog_manager._get_policy_lookup(loaded) is (
+            self.catalog_manager._get_policy_lookup(loaded)
+        )
+
+        # Saving a new index invalidates the cache
+        self.catalog_manager._save_policy_index(policy_index)
+        assert self.catalog_manager._load_policy_index() is not loaded
+
+    def test_iter_policy_files_skips_tests_and_resources(self):
+        """Test that index candidates exclude test and resource files."""
+        names = [
+            "pod/policy.yaml",
+            "pod/kyverno-test.yaml",
+            "pod/resource.yaml",
+            "pod/test-pod.yaml",
+            "pod/pod-bad.yaml",
+            "pod/notes.md",
+            "pod/.chainsaw-test/chainsaw-step.yaml",
+        ]
+        for name in names:
+            path = os.path.join(self.catalog_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+
+        result = list(self.catalog_manager._iter_policy_files(self.catalog_dir))
+        assert result == [os.path.join(self.catalog_dir, "pod", "policy.yaml")]
+
+    def test_find_policy_files(self):
+        """Test finding policy files without shelling out to grep."""
+        repo_dir = os.path.join(self.temp_dir, "repo")
+        files = {
+            "pod/policy.yaml": "kind: ClusterPolicy\nspec:\n  validationFailureAction: Audit\n",
+            "pod/no-action.yaml": "kind: ClusterPolicy\nspec: {}\n",
+            "pod/report.yaml": "kind: ClusterPolicyReport\nvalidationFailureAction: x\n",
+            "pod/policy.yml": "kind: ClusterPolicy\nvalidationFailureAction: Audit\n",
+            ".hidden/policy.yaml": "kind: ClusterPolicy\nvalidationFailureAction: Audit\n",
+        }
+        for rel_path, content in files.items():
+            path = os.path.join(repo_dir, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+
+        result = self.catalog_manager._find_policy_files(repo_dir)
+        assert result == [os.path.join(repo_dir, "pod", "policy.yaml")]
+
+    def test_sparse_paths_config(self):
+        """Test sparse_paths accepts a single path and rejects non-lists."""
+        with patch.object(
+            self.catalog_manager, "_clone_repository", return_value=None
+        ) as mock_clone:
+            self.catalog_manager.create_catalog_from_repos(
+                [{"url": "https://github.com/test/repo", "sparse_paths": "pod"}]
+            )
+        mock_clone.assert_called_once_with(
+            "https://github.com/test/repo", "main", ["pod"]
+        )
+
+        with pytest.raises(CatalogError):
+            self.catalog_manager.create_catalog_from_repos(
+                [{"url": "https://github.com/test/repo", "sparse_paths": {"a": 1}}]
+            )
+
+    def test_clone_workers_at_least_one(self):
+        """Test a non-positive clone_workers setting still clones repositories."""
+        self.config["catalog"]["clone_workers"] = 0
+        manager = PolicyCatalogManager(self.config)
+
+        with patch.object(
+            manager, "_clone_repository", return_value=None
+        ) as mock_clone:
+            manager.create_catalog_from_repos(["https://github.com/test/repo"])
+
+        mock_clone.assert_called_once_with("https://github.com/test/repo", "main", None)
+
+    @requires_git
+    def test_create_catalog_from_same_named_repos(self):
+        """Test same-named repositories are cloned into separate directories."""
+        first = _init_git_repo(
+            os.path.join(self.temp_dir, "host-a", "acme", "policies"),
+            {"first/policy.yaml": POLICY_YAML},
+        )
+        second = _init_git_repo(
+            os.path.join(self.temp_dir, "host-b", "acme", "policies"),
+            {"second/policy.yaml": POLICY_YAML},
+        )
+
+        assert self.catalog_manager._get_repo_directory_name(
+            first, "main"
+        ) != self.catalog_manager._get_repo_directory_name(second, "main")
+
+        self.catalog_manager.create_catalog_from_repos(
+            [first, second, {"url": first, "branch": "main"}]
+        )
+
+        for rel_path in ("first/policy.yaml", "second/policy.yaml"):
+            assert os.path.exists(os.path.join(self.catalog_dir, rel_path))
+
+    @requires_git
+    def test_repo_cache_follows_sparse_paths(self):
+        """Test a cached sparse clone is widened once sparse_paths is removed."""
+        url = _init_git_repo(
+            os.path.join(self.temp_dir, "origin", "acme", "policies"),
+            {"a/policy.yaml": POLICY_YAML, "b/policy.yaml": POLICY_YAML},
+        )
+        self.config["catalog"]["repo_cache"] = os.path.join(self.temp_dir, "cache")
+        manager = PolicyCatalogManager(self.config)
+
+        manager.create_catalog_from_repos([{"url": url, "sparse_paths": ["a"]}])
+        assert os.path.exists(os.path.join(self.catalog_dir, "a", "policy.yaml"))
+        assert not os.path.exists(os.path.join(self.catalog_dir, "b"))
+
+        # Still within repo_cache_ttl, but the checkout no longer matches config
+        manager.create_catalog_from_repos([url])
+        assert os.path.exists(os.path.join(self.catalog_dir, "a", "policy.yaml"))
+        assert os.path.exists(os.path.join(self.catalog_dir, "b", "policy.yaml"))
+
+    @requires_git
+    def test_repo_cache_rejects_other_origin(self):
+        """Test a cached clone of a different remote is not reused."""
+        url = _init_git_repo(
+            os.path.join(self.temp_dir, "origin", "acme", "policies"),
+            {"a/policy.yaml": POLICY_YAML},
+        )
+        self.config["catalog"]["repo_cache"] = os.path.join(self.temp_dir, "cache")
+        manager = PolicyCatalogManager(self.config)
+
+        repo_dir = manager._clone_repository(url, "main")
+        assert manager._update_cached_repository(repo_dir, url, "main")
+        assert not manager._update_cached_repository(
+            repo_dir, "https://gitlab.com/acme/policies", "main"
+        )
+
 
 class TestPolicyIndexer:
     """Test PolicyIndexer functionality."""
@@ -312,6 +478,24 @@ class TestGitHubProcessor:
         result = self.processor.find_policy_files(empty_dir)
         assert result == []
 
+    def test_find_policy_files(self):
+        """Test finding policy files skips hidden directories and non-policies."""
+        repo_dir = os.path.join(self.temp_dir, "repo")
+        files = {
+            "pod/policy.yaml": POLICY_YAML,
+            "pod/no-action.yaml": "kind: ClusterPolicy\nspec: {}\n",
+            "pod/policy.yml": POLICY_YAML,
+            ".github/policy.yaml": POLICY_YAML,
+        }
+        for rel_path, content in files.items():
+            path = os.path.join(repo_dir, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+
+        result = self.processor.find_policy_files(repo_dir)
+        assert result == [os.path.join(repo_dir, "pod", "policy.yaml")]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
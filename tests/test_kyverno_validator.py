@@ -11,6 +11,7 @@ from pathlib import Path
 
 from ai.kyverno_validator import KyvernoValidator
 from exceptions import ValidationError
+from models import PolicyCatalogEntry, RecommendedPolicy
 
 
 class TestKyvernoValidator(unittest.TestCase):
@@ -347,6 +348,66 @@ Error: failed to parse resource file /path/to/resource.yaml: invalid YAML
             with self.assertRaises(ValidationError):
                 self.validator.validate_policies(self.temp_dir)
 
+    def test_validate_policies_with_report_batches_missing_tests(self):
+        """Test missing test cases are generated in one batch, keyed by policy."""
+        with patch.object(KyvernoValidator, "_check_kyverno_cli", return_value=True):
+            validator = KyvernoValidator(bedrock_client=Mock(), enable_ai_fixes=True)
+
+        policies = []
+        for name in ("policy-a", "policy-b"):
+            policy_dir = os.path.join(self.temp_dir, "security", name)
+            os.makedirs(policy_dir)
+            with open(os.path.join(policy_dir, f"{name}.yaml"), "w") as f:
+                f.write(self.policy_content)
+            policies.append(
+                RecommendedPolicy(
+                    original_policy=PolicyCatalogEntry(
+                        name=name,
+                        category="security",
+                        description="Test policy",
+                        relative_path=f"security/{name}.yaml",
+                    ),
+                    customized_content=self.policy_content,
+                )
+            )
+
+        generator = validator.test_case_generator
+        with patch.object(
+            validator, "_execute_kyverno_cli_test", return_value={}
+        ), patch.object(
+            generator,
+            "generate_test_cases_batch",
+            return_value={"policy-a": "test-a", "policy-b": "test-b"},
+        ) as mock_batch, patch.object(
+            generator, "generate_comprehensive_test_case"
+        ) as mock_single:
+            results, _ = validator.validate_policies_with_report(
+                policies, self.temp_dir
+            )
+
+        mock_batch.assert_called_once_with(
+            {"policy-a": self.policy_content, "policy-b": self.policy_content}
+        )
+        mock_single.assert_not_called()
+        self.assertTrue(all(result.generated_tests for result in results))
+        for name, expected in (("policy-a", "test-a"), ("policy-b", "test-b")):
+            test_file = os.path.join(
+                self.temp_dir, "security", name, "kyverno-test.yaml"
+            )
+            with open(test_file) as f:
+                self.assertEqual(f.read(), expected)
+
+    def test_requires_resource_limits(self):
+        """Test structural detection of resource limit policies."""
+        policy_data = yaml.safe_load(self.policy_content)
+        self.assertFalse(self.validator._requires_resource_limits(policy_data))
+
+        containers = policy_data["spec"]["rules"][0]["validate"]["pattern"]["spec"][
+            "containers"
+        ]
+        containers[0]["resources"]["limits"] = {"memory": "?*"}
+        self.assertTrue(self.validator._requires_resource_limits(policy_data))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -297,6 +297,99 @@ class TestOutputManager(unittest.TestCase):
         self.assertTrue(os.path.exists(test_dir))
         self.assertTrue(os.path.isdir(test_dir))
 
+    def test_extract_kinds_fast(self):
+        """Test kind extraction without a full YAML parse."""
+        content = """spec:
+  rules:
+  - name: flow-style
+    match:
+      any:
+      - resources:
+          kinds: ["Pod", Deployment]
+  - name: block-style
+    match:
+      resources:
+        kinds:
+        - Service
+        - 'Ingress'
+"""
+        kinds = self.output_manager._extract_kinds_fast(content)
+        self.assertEqual(kinds, {"Pod", "Deployment", "Service", "Ingress"})
+        self.assertEqual(
+            kinds,
+            self.output_manager._extract_kinds_from_yaml(yaml.safe_load(content)),
+        )
+
+        # Exclude blocks fall back to the full parse
+        self.assertEqual(
+            self.output_manager._extract_kinds_fast(content + "    exclude:\n"),
+            set(),
+        )
+
+        # So do match.all blocks, which the YAML extraction does not read
+        match_all = """spec:
+  rules:
+  - name: all-style
+    match:
+      all:
+      - resources:
+          kinds:
+          - Secret
+"""
+        self.assertEqual(self.output_manager._extract_kinds_fast(match_all), set())
+        self.assertEqual(
+            self.output_manager._extract_kinds_from_yaml(yaml.safe_load(match_all)),
+            set(),
+        )
+
+    def test_extract_kinds_fast_partial_scan(self):
+        """Test kinds the scan cannot fully read are left to the YAML parse."""
+        # Comment lines inside a block list do not cut the list short
+        commented = """spec:
+  rules:
+  - name: block-style
+    match:
+      resources:
+        kinds:
+        - Pod
+        # workloads
+        - Deployment
+"""
+        self.assertEqual(
+            self.output_manager._extract_kinds_fast(commented), {"Pod", "Deployment"}
+        )
+
+        # A rule written as a flow mapping is not scanned, so nothing is returned
+        flow_mapping = """spec:
+  rules:
+  - name: flow-mapping
+    match: {any: [{resources: {kinds: [Pod, Service]}}]}
+  - name: block-style
+    match:
+      resources:
+        kinds:
+        - Deployment
+"""
+        self.assertEqual(self.output_manager._extract_kinds_fast(flow_mapping), set())
+        self.assertEqual(
+            self.output_manager._extract_kinds_from_yaml(yaml.safe_load(flow_mapping)),
+            {"Pod", "Service", "Deployment"},
+        )
+
+    def test_generate_sample_resource_special_case_skips_parse(self):
+        """Test special-case policies never parse the policy YAML."""
+        policy = self.sample_policies[0]
+        policy.original_policy.name = "disallow-default-namespace"
+        policy.customized_content = "exclude: [unparsed"
+
+        with patch("ai.output_manager.yaml.safe_load") as mock_load:
+            resource = self.output_manager._generate_sample_resource(policy)
+
+        mock_load.assert_not_called()
+        self.assertEqual(
+            resource, self.output_manager._generate_namespace_test_resources()
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
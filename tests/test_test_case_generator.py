@@ -0,0 +1,79 @@
+"""
+Tests for test case generator functionality.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from ai.bedrock_client import BedrockClient
+from ai import test_case_generator
+
+
+class TestTestCaseGenerator(unittest.TestCase):
+    """Test cases for TestCaseGenerator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Imported through the module so pytest does not collect the Test* class
+        self.generator = test_case_generator.TestCaseGenerator(Mock(spec=BedrockClient))
+
+    def test_generate_test_cases_batch_keyed_by_policy_name(self):
+        """Test batch results are keyed by the policy they were generated for."""
+        policies = {f"policy-{i}": f"content-{i}" for i in range(10)}
+
+        with patch.object(
+            self.generator,
+            "generate_comprehensive_test_case",
+            side_effect=lambda content, name: f"{name}:{content}",
+        ):
+            test_cases = self.generator.generate_test_cases_batch(policies)
+
+        self.assertEqual(
+            test_cases,
+            {name: f"{name}:{content}" for name, content in policies.items()},
+        )
+
+    def test_generate_test_cases_batch_failure_does_not_abort(self):
+        """Test a failing policy falls back without affecting the others."""
+
+        def generate(content, name):
+            if name == "broken-policy":
+                raise RuntimeError("generation failed")
+            return f"test for {name}"
+
+        with patch.object(
+            self.generator, "generate_comprehensive_test_case", side_effect=generate
+        ):
+            test_cases = self.generator.generate_test_cases_batch(
+                {"good-policy": "a", "broken-policy": "b", "other-policy": "c"}
+            )
+
+        self.assertEqual(test_cases["good-policy"], "test for good-policy")
+        self.assertEqual(test_cases["other-policy"], "test for other-policy")
+        self.assertEqual(
+            test_cases["broken-policy"],
+            self.generator._generate_minimal_test_case("broken-policy"),
+        )
+
+    def test_generate_test_cases_batch_invalid_policy_uses_minimal(self):
+        """Test an unparseable policy gets a minimal test case in the batch."""
+        test_cases = self.generator.generate_test_cases_batch(
+            {"not-a-policy": "kind: ConfigMap"}
+        )
+
+        self.assertEqual(
+            test_cases,
+            {
+                "not-a-policy": self.generator._generate_minimal_test_case(
+                    "not-a-policy"
+                )
+            },
+        )
+
+    def test_generate_test_cases_batch_empty(self):
+        """Test an empty batch does not start any work."""
+        self.assertEqual(self.generator.generate_test_cases_batch({}), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,12 +3,18 @@ File system utility functions for AEGIS.
 Handles common file operations with proper error handling.
 """
 
+import json
 import os
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 from exceptions import FileSystemError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class FileUtils:
     """Utility class for file system operations."""
@@ -93,6 +99,32 @@ class FileUtils:
         except Exception as e:
             raise FileSystemError(f"Failed to list files in {directory_path}", str(e))
 
+    @staticmethod
+    def find_files(
+        directory_path: str, predicate: Callable[[str], bool], suffix: str = ".yaml"
+    ) -> List[str]:
+        """Find files with suffix whose path satisfies predicate.
+
+        Hidden directories such as .git are not descended into, and files the
+        predicate cannot read (OSError or ValueError) are skipped.
+        """
+        matches = []
+        for dirpath, dirnames, filenames in os.walk(directory_path):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+
+            for filename in filenames:
+                if not filename.endswith(suffix):
+                    continue
+
+                file_path = os.path.join(dirpath, filename)
+                try:
+                    if predicate(file_path):
+                        matches.append(file_path)
+                except (OSError, ValueError):
+                    continue
+
+        return matches
+
     @staticmethod
     def read_file(file_path: str) -> str:
         """Read file content as string."""
@@ -119,6 +151,40 @@ class FileUtils:
         except Exception as e:
             raise FileSystemError(f"Failed to write file {file_path}", str(e))
 
+    @staticmethod
+    def read_json(file_path: str) -> Any:
+        """Read a JSON file, using orjson when it is installed."""
+        try:
+            path = Path(file_path).expanduser()
+            if orjson is not None:
+                with open(path, "rb") as f:
+                    return orjson.loads(f.read())
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise FileSystemError(f"File not found: {file_path}")
+        except Exception as e:
+            raise FileSystemError(f"Failed to read JSON file {file_path}", str(e))
+
+    @staticmethod
+    def write_json(file_path: str, data: Any, create_dirs: bool = True) -> None:
+        """Write data as indented JSON, using orjson when it is installed."""
+        try:
+            path = Path(file_path).expanduser()
+
+            if create_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+
+            if orjson is not None:
+                # Same layout as json.dump(indent=2, ensure_ascii=False)
+                with open(path, "wb") as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            raise FileSystemError(f"Failed to write JSON file {file_path}", str(e))
+
     @staticmethod
     def file_exists(file_path: str) -> bool:
         """Check if file exists."""
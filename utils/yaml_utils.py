@@ -7,6 +7,16 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from exceptions import FileSystemError
+from utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without LibYAML bindings
+    from yaml import SafeLoader, SafeDumper
+
+    logger.debug("LibYAML bindings unavailable, using pure-Python YAML parser")
 
 
 class YamlUtils:
@@ -18,7 +28,7 @@ class YamlUtils:
         try:
             path = Path(file_path).expanduser()
             with open(path, "r", encoding="utf-8") as f:
-                content = yaml.safe_load(f)
+                content = yaml.load(f, Loader=SafeLoader)
                 return content if content is not None else {}
         except FileNotFoundError:
             raise FileSystemError(f"YAML file not found: {file_path}")
@@ -33,10 +43,9 @@ class YamlUtils:
         try:
             path = Path(file_path).expanduser()
             with open(path, "r", encoding="utf-8") as f:
-                # Try to load all documents and return the first valid one
-                documents = list(yaml.safe_load_all(f))
-                for doc in documents:
-                    if doc is not None and isinstance(doc, dict):
+                # Return the first valid document, parsing no further than it
+                for doc in yaml.load_all(f, Loader=SafeLoader):
+                    if isinstance(doc, dict):
                         return doc
                 return {}
         except FileNotFoundError:
@@ -46,7 +55,7 @@ class YamlUtils:
             try:
                 path = Path(file_path).expanduser()
                 with open(path, "r", encoding="utf-8") as f:
-                    content = yaml.safe_load(f)
+                    content = yaml.load(f, Loader=SafeLoader)
                     return content if content is not None else {}
             except:
                 raise FileSystemError(f"Invalid YAML in file {file_path}", str(e))
@@ -65,7 +74,14 @@ class YamlUtils:
                 path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(path, "w", encoding="utf-8") as f:
-                yaml.dump(data, f, default_flow_style=False, indent=2, sort_keys=False)
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                    indent=2,
+                    sort_keys=False,
+                )
         except Exception as e:
             raise FileSystemError(f"Error writing YAML file {file_path}", str(e))
 
@@ -101,16 +117,15 @@ class YamlUtils:
             if not yaml_content or not yaml_content.strip():
                 return {}
 
-            # Try to load all documents and return the first valid one
-            documents = list(yaml.safe_load_all(yaml_content))
-            for doc in documents:
-                if doc is not None and isinstance(doc, dict):
+            # Return the first valid document, parsing no further than it
+            for doc in yaml.load_all(yaml_content, Loader=SafeLoader):
+                if isinstance(doc, dict):
                     return doc
             return {}
         except yaml.YAMLError as e:
             # If multi-document parsing fails, try single document
             try:
-                content = yaml.safe_load(yaml_content)
+                content = yaml.load(yaml_content, Loader=SafeLoader)
                 return content if content is not None else {}
             except:
                 raise FileSystemError(f"Invalid YAML content", str(e))
@@ -121,7 +136,13 @@ class YamlUtils:
     def dump_yaml_safe(data: Dict[str, Any]) -> str:
         """Convert data to YAML string safely."""
         try:
-            return yaml.dump(data, default_flow_style=False, indent=2, sort_keys=False)
+            return yaml.dump(
+                data,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                indent=2,
+                sort_keys=False,
+            )
         except Exception as e:
             raise FileSystemError(f"Error converting data to YAML string", str(e))
 